@@ -9,6 +9,7 @@ IMPORTANT ARCHITECTURE RULE:
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 
 from core.config.config_loader import LABELS_TSV_PATH, MODULES_JSON_PATH, PROJECT_ROOT_PATH_T
@@ -136,6 +137,7 @@ class AppContext:
         Determine active language:
         1) user-specific  2) global  3) fallback 'de'
         """
+        T.cache_clear()  # language may have changed -> drop memoized labels
         lang = cls.settings_manager.get("app", "language", user_specific=True, fallback=None)
         if lang is None:
             lang = cls.settings_manager.get("app", "language", fallback="de")
@@ -160,7 +162,9 @@ class AppContext:
 # ------------------------------------------------------------------ #
 #  Translation shortcut                                              #
 # ------------------------------------------------------------------ #
+@lru_cache(maxsize=1024)
 def T(label: str) -> str:
+    """Translate *label*; memoized until the next update_language()."""
     lang = AppContext.settings_manager.get("app", "language", user_specific=True, fallback="de")
     return translations.t(label, lang)  # logs missing keys once
 
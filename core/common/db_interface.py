@@ -17,9 +17,22 @@ def create_sqlite_connection(
     *,
     check_same_thread: bool = False,
     foreign_keys: bool = False,
+    isolation_level: Optional[str] = "",
+    cached_statements: int = 128,
 ) -> sqlite3.Connection:
-    """Create a sqlite3 connection with common defaults."""
-    conn = sqlite3.connect(str(db_path), check_same_thread=check_same_thread)
+    """
+    Create a sqlite3 connection with common defaults.
+
+    ``isolation_level=None`` switches the connection to autocommit mode; the
+    caller is then responsible for explicit ``BEGIN``/``COMMIT``.
+    ``cached_statements`` sizes the per-connection prepared-statement cache.
+    """
+    conn = sqlite3.connect(
+        str(db_path),
+        check_same_thread=check_same_thread,
+        isolation_level=isolation_level,
+        cached_statements=cached_statements,
+    )
     conn.row_factory = sqlite3.Row
     if foreign_keys:
         conn.execute("PRAGMA foreign_keys = ON")
@@ -48,11 +61,13 @@ class SQLiteRepository(DatabaseAccess):
         *,
         check_same_thread: bool = False,
         foreign_keys: bool = False,
+        cached_statements: int = 128,
     ) -> None:
         self._db_path = Path(db_path)
         self._conn: Optional[sqlite3.Connection] = None
         self._check_same_thread = check_same_thread
         self._foreign_keys = foreign_keys
+        self._cached_statements = cached_statements
 
     @property
     def db_path(self) -> Path:
@@ -68,6 +83,7 @@ class SQLiteRepository(DatabaseAccess):
                 self._db_path,
                 check_same_thread=self._check_same_thread,
                 foreign_keys=self._foreign_keys,
+                cached_statements=self._cached_statements,
             )
         return self._conn
 
@@ -76,6 +92,7 @@ class SQLiteRepository(DatabaseAccess):
             self._db_path,
             check_same_thread=self._check_same_thread,
             foreign_keys=self._foreign_keys,
+            cached_statements=self._cached_statements,
         )
 
     def close(self) -> None:
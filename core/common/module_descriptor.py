@@ -5,6 +5,8 @@ core/common/module_descriptor.py
 DTO + Loader helpers for modules (meta.json based).
 
 • from_meta_json(path): reads/validates meta and creates descriptor
+  (memoized per file on mtime/size; unchanged meta.json is parsed once;
+  parsed with ``orjson`` when installed)
 • settings_class (optional): fully qualified Settings-Tab class
 • visible_for / settings_for stored as JSON strings
 • License fields: license_required, license_tag (optional)
@@ -12,17 +14,24 @@ DTO + Loader helpers for modules (meta.json based).
 
 from __future__ import annotations
 
+import functools
 import importlib
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Optional
 
+from core.helpers.json_helper import loads as _loads
 from core.models.user import UserRole
 from core.qm_logging.logic.logger import logger
 
 
-@dataclass
+# Erfolgreich geladene Hauptklassen je (module_path, class_name). Fehlschläge
+# werden bewusst nicht gemerkt, damit jeder Versuch wieder geloggt wird.
+_CLASS_CACHE: dict[tuple[str, str], type] = {}
+
+
+@dataclass(slots=True)
 class ModuleDescriptor:
     # Persisted fields
     id: str
@@ -46,14 +55,14 @@ class ModuleDescriptor:
     @property
     def visible_list(self) -> list[str]:
         try:
-            return json.loads(self.visible_for) if self.visible_for else []
+            return _loads(self.visible_for) if self.visible_for else []
         except json.JSONDecodeError:
             return []
 
     @property
     def settings_list(self) -> list[str]:
         try:
-            return json.loads(self.settings_for) if self.settings_for else []
+            return _loads(self.settings_for) if self.settings_for else []
         except json.JSONDecodeError:
             return []
 
@@ -111,11 +120,18 @@ class ModuleDescriptor:
         - Full traceback is logged on failure.
         - Missing class in an importable module is logged.
         - The method is crash-safe (returns None on error).
+        - Successfully loaded classes are cached per process.
         """
+        key = (self.module_path, self.class_name)
+        cls = _CLASS_CACHE.get(key)
+        if cls is not None:
+            return cls
         try:
             mod = importlib.import_module(self.module_path)
             cls = getattr(mod, self.class_name, None)
-            if cls is None:
+            if cls is not None:
+                _CLASS_CACHE[key] = cls
+            else:
                 logger.log(
                     "ModuleDescriptor",
                     "ImportError",
@@ -157,7 +173,15 @@ class ModuleDescriptor:
 
     @classmethod
     def from_meta_json(cls, meta_file: Path) -> "ModuleDescriptor":
-        data = json.loads(meta_file.read_text(encoding="utf-8"))
+        """Descriptor for *meta_file*; re-parsed only when the file changed."""
+        st = meta_file.stat()
+        cached = _meta_json_cached(cls, str(meta_file), st.st_mtime_ns, st.st_size)
+        # Descriptor ist mutabel → Kopie, damit der Cache unverändert bleibt
+        return replace(cached)
+
+    @classmethod
+    def _parse_meta_json(cls, meta_file: Path) -> "ModuleDescriptor":
+        data = _loads(meta_file.read_bytes())
 
         for key in ("id", "label", "version", "main_class"):
             if key not in data or not str(data[key]).strip():
@@ -201,3 +225,9 @@ class ModuleDescriptor:
             license_required=license_required,
             license_tag=license_tag,
         )
+
+
+@functools.lru_cache(maxsize=256)
+def _meta_json_cached(cls: type, path: str, mtime_ns: int, size: int) -> ModuleDescriptor:
+    # mtime/size sind Teil des Schlüssels: geänderte Dateien werden neu gelesen
+    return cls._parse_meta_json(Path(path))
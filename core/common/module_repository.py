@@ -16,6 +16,51 @@ from core.common.module_descriptor import ModuleDescriptor
 from core.common.module_auto_discovery import discover_meta_files, default_roots
 from core.common.db_interface import SQLiteRepository
 
+_UPSERT_SQL = """
+    INSERT INTO modules (
+        id, label, module_path, class_name, version, enabled, is_core,
+        sort_order, visible_for, settings_for, requires_login, permissions,
+        settings_class, meta_path, license_required, license_tag
+    ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
+    ON CONFLICT(id) DO UPDATE SET
+        label=excluded.label,
+        module_path=excluded.module_path,
+        class_name=excluded.class_name,
+        version=excluded.version,
+        enabled=excluded.enabled,
+        is_core=excluded.is_core,
+        sort_order=excluded.sort_order,
+        visible_for=excluded.visible_for,
+        settings_for=excluded.settings_for,
+        requires_login=excluded.requires_login,
+        permissions=excluded.permissions,
+        settings_class=excluded.settings_class,
+        meta_path=excluded.meta_path,
+        license_required=excluded.license_required,
+        license_tag=excluded.license_tag
+"""
+
+
+def _upsert_params(desc: ModuleDescriptor) -> tuple:
+    return (
+        desc.id,
+        desc.label,
+        desc.module_path,
+        desc.class_name,
+        desc.version,
+        desc.enabled,
+        desc.is_core,
+        desc.sort_order,
+        desc.visible_for,
+        desc.settings_for,
+        desc.requires_login,
+        desc.permissions,
+        desc.settings_class,
+        desc.meta_path,
+        desc.license_required,
+        desc.license_tag,
+    )
+
 
 class ModuleRepository(SQLiteRepository):
     def __init__(self) -> None:
@@ -57,50 +102,12 @@ class ModuleRepository(SQLiteRepository):
 
     # ---------------- CRUD ------------------- #
     def upsert(self, desc: ModuleDescriptor) -> None:
+        self.upsert_many([desc])
+
+    def upsert_many(self, descs: Iterable[ModuleDescriptor]) -> None:
+        """Insert/update all *descs* in one transaction (ein Commit)."""
         with self.conn:
-            self.conn.execute(
-                """
-                INSERT INTO modules (
-                    id, label, module_path, class_name, version, enabled, is_core,
-                    sort_order, visible_for, settings_for, requires_login, permissions,
-                    settings_class, meta_path, license_required, license_tag
-                ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                ON CONFLICT(id) DO UPDATE SET
-                    label=excluded.label,
-                    module_path=excluded.module_path,
-                    class_name=excluded.class_name,
-                    version=excluded.version,
-                    enabled=excluded.enabled,
-                    is_core=excluded.is_core,
-                    sort_order=excluded.sort_order,
-                    visible_for=excluded.visible_for,
-                    settings_for=excluded.settings_for,
-                    requires_login=excluded.requires_login,
-                    permissions=excluded.permissions,
-                    settings_class=excluded.settings_class,
-                    meta_path=excluded.meta_path,
-                    license_required=excluded.license_required,
-                    license_tag=excluded.license_tag
-                """,
-                (
-                    desc.id,
-                    desc.label,
-                    desc.module_path,
-                    desc.class_name,
-                    desc.version,
-                    desc.enabled,
-                    desc.is_core,
-                    desc.sort_order,
-                    desc.visible_for,
-                    desc.settings_for,
-                    desc.requires_login,
-                    desc.permissions,
-                    desc.settings_class,
-                    desc.meta_path,
-                    desc.license_required,
-                    desc.license_tag,
-                ),
-            )
+            self.conn.executemany(_UPSERT_SQL, map(_upsert_params, descs))
 
     def get_by_id(self, module_id: str) -> Optional[ModuleDescriptor]:
         row = self.conn.execute("SELECT * FROM modules WHERE id=?", (module_id,)).fetchone()
@@ -131,13 +138,32 @@ class ModuleRepository(SQLiteRepository):
         Gibt Anzahl verarbeiteter Einträge zurück.
         """
         meta_files = discover_meta_files(list(roots) if roots else default_roots())
-        count = 0
+        descs: List[ModuleDescriptor] = []
         for meta in meta_files:
             try:
-                self.upsert_from_meta(meta)
-                count += 1
+                descs.append(ModuleDescriptor.from_meta_json(meta))
             except Exception as exc:  # noqa: BLE001
                 logger.log("ModuleRepository", "MetaImportFailed", message=f"{meta}: {exc}")
+        # Alle gültigen meta.json in einer Transaktion schreiben; scheitert der
+        # Batch (z. B. ein Wert verletzt NOT NULL), einzeln nachziehen, damit
+        # ein fehlerhaftes Modul die übrigen nicht mitreißt
+        try:
+            self.upsert_many(descs)
+        except Exception as exc:  # noqa: BLE001
+            logger.log("ModuleRepository", "BatchUpsertFailed", message=str(exc))
+            descs = [desc for desc in descs if self._try_upsert(desc)]
+        for desc in descs:
+            logger.log("ModuleRepository", "UpsertFromMeta", message=f"{desc.id}:{desc.version}")
+        count = len(descs)
         if count:
             logger.log("ModuleRepository", "AutoDiscovery", message=f"{count} modules registered/updated")
         return count
+
+    def _try_upsert(self, desc: ModuleDescriptor) -> bool:
+        """Einzel-Upsert für den Fallback in discover_and_register(); loggt Fehler."""
+        try:
+            self.upsert(desc)
+        except Exception as exc:  # noqa: BLE001
+            logger.log("ModuleRepository", "MetaImportFailed", message=f"{desc.meta_path or desc.id}: {exc}")
+            return False
+        return True
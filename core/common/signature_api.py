@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Optional, Tuple, Union, Any
 
-from core.settings.logic.settings_manager import SettingsManager
+from core.settings.logic.settings_manager import settings_manager
 
 # Fallback-Logger (falls AppContext.logger fehlt)
 try:
@@ -59,7 +59,7 @@ class SignatureAPI:
         ctx = self._ctx()
         sm = getattr(ctx, "settings_manager", None) if ctx else None
         if sm is None:
-            sm = SettingsManager()
+            sm = settings_manager
             try:
                 if ctx:
                     ctx.settings_manager = sm  # type: ignore[attr-defined]
@@ -7,6 +7,7 @@ with special focus on UTC and Europe/Berlin timezone handling for logging and di
 All features and modules should use ONLY these helpers for date/time logic.
 """
 
+import time as _time
 from datetime import datetime, date, time, timezone
 
 try:
@@ -16,6 +17,8 @@ except ImportError:
 
 # Local timezone for display (can be made configurable)
 LOCAL_TZ = ZoneInfo("Europe/Berlin")
+# Display format for local timestamps (GUI, exports)
+LOCAL_DISPLAY_FMT = "%d.%m.%Y %H:%M:%S"
 
 def utc_now_iso() -> str:
     """
@@ -24,6 +27,30 @@ def utc_now_iso() -> str:
     """
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") – als Tupel, damit Lesen/Schreiben atomar ist
+_iso_second_cache = (-1, "")
+
+
+def utc_now_iso_us() -> str:
+    """
+    Returns the current UTC time as ISO8601 string with microseconds
+    (YYYY-MM-DDTHH:MM:SS.ffffff+00:00), e.g. for log timestamps.
+
+    Fast path without datetime objects: the date/time part is formatted
+    at most once per second, only the fraction is formatted per call.
+    """
+    global _iso_second_cache
+    sec, ns = divmod(_time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _iso_second_cache
+    if sec != cached_sec:
+        t = _time.gmtime(sec)
+        prefix = (
+            f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+        )
+        _iso_second_cache = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}+00:00"
+
 def local_date_to_utc_range(start: date, end: date):
     """
     Converts local start and end dates (as date objects) to UTC datetime range strings.
@@ -48,7 +75,7 @@ def utc_to_local_str(utc_iso: str) -> str:
     """
     dt_utc = datetime.fromisoformat(utc_iso)
     dt_local = dt_utc.astimezone(LOCAL_TZ)
-    return dt_local.strftime("%d.%m.%Y %H:%M:%S")
+    return dt_local.strftime(LOCAL_DISPLAY_FMT)
 
 def local_to_utc_iso(dt_local: datetime) -> str:
     """
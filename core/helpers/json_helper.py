@@ -0,0 +1,40 @@
+"""
+json_helper.py
+
+Single place for the optional ``orjson`` dependency. All modules that want
+fast JSON use these helpers instead of their own try-import.
+
+• loads(data)       → like json.loads (str or bytes)
+• dumps_bytes(obj)  → compact UTF-8 JSON bytes
+
+``orjson`` is used when installed (pip install orjson), otherwise the standard
+library. Note the differences of orjson: NaN/Infinity are written as null,
+integers beyond 64 bit are rejected on write and read back as float. Callers
+that must round-trip such values exactly use the stdlib json module.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON; raises ValueError (json.JSONDecodeError) on invalid input."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Compact JSON as UTF-8 bytes; raises TypeError for unsupported values."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
@@ -10,21 +10,48 @@ Relies on a separate controller class that encapsulates all logic.
 Can be used standalone for testing or integrated into a larger application.
 """
 
+import functools
+from concurrent.futures import Future, ThreadPoolExecutor
 import tkinter as tk                     # <— NEU: stellt das Kürzel „tk“ bereit
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk
 from datetime import date
-from typing import Optional
-from tkcalendar import DateEntry
-
-# ------------------------------------------------------------
-# Optional dependency: tkcalendar
-# ------------------------------------------------------------
-try:
-    from tkcalendar import DateEntry
-    _TKCALENDAR_AVAILABLE = True
-except ImportError:
-    DateEntry = None  # type: ignore
-    _TKCALENDAR_AVAILABLE = False
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+# tkcalendar (optional), filedialog und messagebox werden erst bei Bedarf
+# importiert – das Modul selbst bleibt damit billig zu laden.
+
+# Anzahl Zeilen im Treeview, bis die echte Höhe bekannt ist
+_DEFAULT_WINDOW_SIZE = 50
+# Zeilen pro Mausrad-Schritt
+_WHEEL_STEP = 3
+# Abfrageintervall für laufende Hintergrund-Aktionen (ms)
+_POLL_MS = 100
+# Verzögerung, bevor eine Filteränderung neu abfragt (ms)
+_REFRESH_DELAY_MS = 250
+# Zeilen pro Block beim Formatieren des JSON-Exports
+_EXPORT_CHUNK = 1_000
+
+_PRINT_KEYS = ("timestamp", "username", "feature", "event", "reference_id", "message", "log_level")
+# JSON-Export: angezeigte Spalten, Schlüssel wie bisher ("user" statt "username")
+_EXPORT_KEYS = ("timestamp", "user", "feature", "event", "reference_id", "message", "log_level")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_ddmmyyyy(text: str) -> date:
+    """'DD.MM.YYYY' → date via int parsing (no strptime); raises ValueError.
+
+    Akzeptiert dasselbe wie ``strptime(text, "%d.%m.%Y")``: Tag/Monat mit 1–2,
+    Jahr mit genau 4 ASCII-Ziffern – "01.02.25" ist kein Jahr 0025.
+    """
+    d, m, y = text.split(".")
+    if not (
+        len(y) == 4 and 1 <= len(m) <= 2 and 1 <= len(d) <= 2
+        and (d + m + y).isascii() and (d + m + y).isdigit()
+    ):
+        raise ValueError(f"Invalid date: {text!r} (expected DD.MM.YYYY)")
+    return date(int(y), int(m), int(d))
+
 
 class LogView(ttk.Frame):
     """
@@ -44,9 +71,13 @@ class LogView(ttk.Frame):
         super().__init__(parent, *args, **kwargs)
         self.controller = controller
 
-        if not _TKCALENDAR_AVAILABLE:
+        # Optional dependency: tkcalendar
+        try:
+            from tkcalendar import DateEntry
+        except ImportError:
             self._show_missing_dependency()
             return
+        self._DateEntry = DateEntry
 
         # Variables to hold filter input values (synchronized with DateEntry widgets)
         self.start_date_var = tk.StringVar()
@@ -60,6 +91,24 @@ class LogView(ttk.Frame):
         self._sort_column = "timestamp"
         self._sort_ascending = False
 
+        # Virtualisierung: im Treeview steht nur das sichtbare Fenster
+        # [lo, hi) – Zeilen-IIDs sind die Positionen im Gesamtergebnis.
+        # SQLite liefert per LIMIT/OFFSET nur die Seiten rund ums Fenster.
+        self._filters: dict = {}
+        self._total = 0
+        self._log_cache: dict[int, tuple] = {}
+        self._window: tuple[int, int] = (0, 0)
+        self._window_size = _DEFAULT_WINDOW_SIZE
+
+        # Archive/Delete/Export laufen auf einem Worker, nicht im Tk-Mainloop
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="logview")
+        self._pending: Optional[Future] = None
+        # Refresh/Scrollen während einer Hintergrund-Aktion → danach einmal neu laden
+        self._refresh_deferred = False
+
+        # Filteränderungen laden entprellt neu (höchstens 1× pro Verzögerung)
+        self._refresh_after_id: Optional[str] = None
+
         self._build_ui()
         self._load_filter_options()
         # Initial sorting set for controller
@@ -88,13 +137,13 @@ class LogView(ttk.Frame):
         filter_frame.pack(fill=tk.X, padx=5, pady=5)
 
         ttk.Label(filter_frame, text="From:").grid(row=0, column=0, sticky=tk.W, padx=2, pady=2)
-        self.start_date_picker = DateEntry(
+        self.start_date_picker = self._DateEntry(
             filter_frame, date_pattern="dd.MM.yyyy", textvariable=self.start_date_var, width=12
         )
         self.start_date_picker.grid(row=0, column=1, padx=2, pady=2)
 
         ttk.Label(filter_frame, text="To:").grid(row=0, column=2, sticky=tk.W, padx=2, pady=2)
-        self.end_date_picker = DateEntry(
+        self.end_date_picker = self._DateEntry(
             filter_frame, date_pattern="dd.MM.yyyy", textvariable=self.end_date_var, width=12
         )
         self.end_date_picker.grid(row=0, column=3, padx=2, pady=2)
@@ -113,7 +162,16 @@ class LogView(ttk.Frame):
         self.log_level_cb.grid(row=2, column=1, padx=2, pady=2)
 
         ttk.Label(filter_frame, text="Reference ID:").grid(row=2, column=2, sticky=tk.W, padx=2, pady=2)
-        ttk.Entry(filter_frame, textvariable=self.reference_id_var, width=20).grid(row=2, column=3, padx=2, pady=2)
+        reference_entry = ttk.Entry(filter_frame, textvariable=self.reference_id_var, width=20)
+        reference_entry.grid(row=2, column=3, padx=2, pady=2)
+
+        # Filteränderungen → entprellter Refresh. Die Datumsfelder nur bei
+        # Auswahl im Kalender, damit halb getippte Daten keinen Fehler zeigen.
+        for cb in (self.feature_cb, self.event_cb, self.log_level_cb):
+            cb.bind("<<ComboboxSelected>>", self._schedule_refresh)
+        for picker in (self.start_date_picker, self.end_date_picker):
+            picker.bind("<<DateEntrySelected>>", self._schedule_refresh)
+        reference_entry.bind("<KeyRelease>", self._schedule_refresh)
 
         btn_frame = ttk.Frame(self)
         btn_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -124,10 +182,21 @@ class LogView(ttk.Frame):
         ttk.Button(btn_frame, text="Export JSON...", command=self._on_export).pack(side=tk.LEFT, padx=2)
         # Print-Button entfernt – wird ggf. in Zukunft vom Print-Modul bereitgestellt
         #ttk.Button(btn_frame, text="Print Logs...", command=self._on_print).pack(side=tk.LEFT, padx=2)
+        # Wird nur während einer Hintergrund-Aktion eingeblendet
+        self._progress = ttk.Progressbar(btn_frame, mode="indeterminate", length=120)
 
         columns = ("timestamp", "username", "feature", "event", "reference_id", "message", "log_level")
-        self.tree = ttk.Treeview(self, columns=columns, show="headings")
-        self.tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        table_frame = ttk.Frame(self)
+        table_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+
+        # Die Scrollbar steuert das Fenster, nicht den Treeview selbst
+        self._vsb = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self._on_yview)
+        self._vsb.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree = ttk.Treeview(table_frame, columns=columns, show="headings")
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.tree.bind("<Configure>", self._on_tree_configure)
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.tree.bind(seq, self._on_mousewheel)
 
         for col, text in zip(
             columns,
@@ -153,9 +222,9 @@ class LogView(ttk.Frame):
         if not date_str.strip():
             return None
         try:
-            from datetime import datetime
-            return datetime.strptime(date_str.strip(), "%d.%m.%Y").date()
+            return _parse_ddmmyyyy(date_str.strip())
         except ValueError:
+            from tkinter import messagebox
             messagebox.showerror("Invalid Date", f"Invalid date format: {date_str}\nExpected DD.MM.YYYY")
             return None
 
@@ -164,7 +233,11 @@ class LogView(ttk.Frame):
         Fetch logs from the controller according to current filter values
         and display them in the treeview table.
         """
-        logs = self.controller.get_logs(
+        self._cancel_scheduled_refresh()
+        if self._defer_while_pending():
+            return
+        self._refresh_deferred = False
+        self._filters = dict(
             start_date=self._parse_date(self.start_date_var.get()),
             end_date=self._parse_date(self.end_date_var.get()),
             feature=self.feature_var.get() or None,
@@ -172,26 +245,135 @@ class LogView(ttk.Frame):
             reference_id=self.reference_id_var.get() or None,
             log_level=self.log_level_var.get() or None,
         )
+        self._total = self.controller.count_logs(**self._filters)
+        self._log_cache = {}
+        # Altes Fenster komplett verwerfen, dann ab Zeile 0 neu aufbauen
+        lo, hi = self._window
+        if hi > lo:
+            self.tree.delete(*(str(i) for i in range(lo, hi)))
+        self._window = (0, 0)
+        self._render_window(0)
+
+    # ---------------------------------------------------------------------
+    # Virtualisierung
+    # ---------------------------------------------------------------------
 
-        # Clear existing rows
-        for row in self.tree.get_children():
-            self.tree.delete(row)
-
-        # Insert new rows
-        for log in logs:
-            self.tree.insert(
-                "",
-                "end",
-                values=(
-                    log.get("timestamp", ""),
-                    log.get("username") or (f"ID:{log.get('user_id')}" if log.get("user_id") else "Unknown"),
-                    log.get("feature"),
-                    log.get("event"),
-                    log.get("reference_id") or "",
-                    log.get("message") or "",
-                    log.get("log_level"),
-                ),
+    @staticmethod
+    def _rows_to_values(logs) -> list[tuple]:
+        """Anzeige-Tupel (Reihenfolge wie die Tree-Spalten) für viele Zeilen."""
+        return [
+            (
+                l.get("timestamp", ""),
+                l.get("username") or (f"ID:{l['user_id']}" if l.get("user_id") else "Unknown"),
+                l.get("feature"),
+                l.get("event"),
+                l.get("reference_id") or "",
+                l.get("message") or "",
+                l.get("log_level"),
             )
+            for l in logs
+        ]
+
+    @classmethod
+    def _export_rows(cls, logs: Iterable[dict]) -> Iterator[dict]:
+        """Export-Dicts mit den angezeigten Werten; blockweise, ohne Gesamtliste."""
+        logs = iter(logs)
+        while True:
+            chunk = list(islice(logs, _EXPORT_CHUNK))
+            if not chunk:
+                return
+            for values in cls._rows_to_values(chunk):
+                yield dict(zip(_EXPORT_KEYS, values))
+
+    def _render_window(self, lo: int) -> None:
+        """
+        Show cache rows [lo, lo + window_size) in the tree.
+
+        Only rows leaving the window are deleted and only rows entering it
+        are inserted, so scrolling costs O(scrolled rows), not O(total).
+        """
+        if self._defer_while_pending():
+            return
+        size = self._window_size
+        lo = max(0, min(lo, self._total - size))
+        self._load_rows(lo, min(self._total, lo + size))
+        # _load_rows kann _total verkleinern (Zeilen inzwischen gelöscht):
+        # neu klemmen und die dadurch ins Fenster gerückten Zeilen nachladen
+        clamped = max(0, min(lo, self._total - size))
+        if clamped != lo:
+            lo = clamped
+            self._load_rows(lo, min(self._total, lo + size))
+        total = self._total
+        cache = self._log_cache
+        hi = min(total, lo + size)
+        # Was trotzdem fehlt (erneut geschrumpft), wird nicht angezeigt;
+        # das Fenster bleibt zusammenhängend
+        hi = next((i for i in range(lo, hi) if i not in cache), hi)
+        old_lo, old_hi = self._window
+
+        stale = [str(i) for i in range(old_lo, old_hi) if i < lo or i >= hi]
+        if stale:
+            self.tree.delete(*stale)
+
+        # Der Cache hält fertige Werte-Tupel → pro Zeile nur ein Tcl-Aufruf
+        insert = self.tree.insert
+        # neue Zeilen oberhalb des alten Fensters (rückwärts an Position 0)
+        for i in range(min(hi, old_lo) - 1, lo - 1, -1):
+            insert("", 0, iid=str(i), values=cache[i])
+        # neue Zeilen unterhalb des alten Fensters
+        for i in range(max(lo, old_hi), hi):
+            insert("", "end", iid=str(i), values=cache[i])
+
+        self._window = (lo, hi)
+        if total:
+            self._vsb.set(lo / total, hi / total)
+        else:
+            self._vsb.set(0.0, 1.0)
+
+    def _load_rows(self, lo: int, hi: int) -> None:
+        """Fehlende Zeilen [lo, hi) plus eine Seite Vorlauf per LIMIT/OFFSET holen."""
+        missing = [i for i in range(lo, hi) if i not in self._log_cache]
+        if not missing:
+            return
+        size = self._window_size
+        first = max(0, missing[0] - size)
+        last = min(self._total, missing[-1] + 1 + size)
+        rows = self.controller.get_logs(**self._filters, offset=first, limit=last - first)
+        if len(rows) < last - first:
+            self._total = first + len(rows)
+
+        # Cache auf das Umfeld des Fensters begrenzen
+        keep_lo, keep_hi = lo - 2 * size, hi + 2 * size
+        self._log_cache = {i: r for i, r in self._log_cache.items() if keep_lo <= i < keep_hi}
+        self._log_cache.update(zip(range(first, first + len(rows)), self._rows_to_values(rows)))
+
+    def _all_logs(self) -> list[dict]:
+        """Complete result set for the current filters (export/print)."""
+        return self.controller.get_logs(**self._filters, limit=self._total)
+
+    def _on_yview(self, *args) -> None:
+        """Scrollbar command: ('moveto', frac) or ('scroll', n, 'units'|'pages')."""
+        lo = self._window[0]
+        if args[0] == "moveto":
+            lo = int(float(args[1]) * self._total)
+        elif args[0] == "scroll":
+            step = int(args[1])
+            lo += step * (self._window_size if args[2] == "pages" else 1)
+        self._render_window(lo)
+
+    def _on_mousewheel(self, event) -> str:
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        self._render_window(self._window[0] + (-_WHEEL_STEP if up else _WHEEL_STEP))
+        return "break"
+
+    def _on_tree_configure(self, event) -> None:
+        """Fenstergröße an die sichtbare Höhe des Treeviews anpassen."""
+        row_height = int(ttk.Style().lookup("Treeview", "rowheight") or 20)
+        # Überschriftenzeile abziehen; lieber eine Zeile zu wenig als abgeschnitten
+        size = max(1, (event.height - row_height - 4) // row_height)
+        if size != self._window_size:
+            self._window_size = size
+            self._render_window(self._window[0])
 
     # ---------------------------------------------------------------------
     # Button- und Tree-Callbacks
@@ -201,6 +383,16 @@ class LogView(ttk.Frame):
         """Refresh logs display when the Refresh button is clicked."""
         self._populate_logs()
 
+    def _schedule_refresh(self, event=None, delay_ms: int = _REFRESH_DELAY_MS) -> None:
+        """(Re)startet den Refresh-Timer; nur die letzte Änderung lädt neu."""
+        self._cancel_scheduled_refresh()
+        self._refresh_after_id = self.after(delay_ms, self._populate_logs)
+
+    def _cancel_scheduled_refresh(self) -> None:
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+
     def _on_sort(self, column):
         """
         Toggle sorting direction when clicking on column headers,
@@ -219,6 +411,7 @@ class LogView(ttk.Frame):
         """
         Archive logs older than the 'From' date filter by exporting to JSON and removing them.
         """
+        from tkinter import filedialog, messagebox
         older_than = self._parse_date(self.start_date_var.get())
         if not older_than:
             messagebox.showerror("Missing Date", "Please select a valid start date for archiving.")
@@ -230,34 +423,43 @@ class LogView(ttk.Frame):
         )
         if not file_path:
             return
-        try:
-            count = self.controller.archive_logs(older_than, file_path)
+
+        def _done(count: int) -> None:
             messagebox.showinfo("Archive Complete", f"{count} logs archived and removed from database.")
             self._populate_logs()
-        except Exception as e:
-            messagebox.showerror("Archive Error", f"Failed to archive logs:\n{e}")
+
+        self._run_in_background(
+            lambda: self.controller.archive_logs(older_than, file_path),
+            _done, "Archive Error", "Failed to archive logs",
+        )
 
     def _on_delete(self):
         """
         Delete logs older than the 'From' date filter after confirmation.
         """
+        from tkinter import messagebox
         older_than = self._parse_date(self.start_date_var.get())
         if not older_than:
             messagebox.showerror("Missing Date", "Please select a valid start date for deletion.")
             return
         if not messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete all logs older than {older_than}?"):
             return
-        try:
-            count = self.controller.delete_logs(older_than)
+
+        def _done(count: int) -> None:
             messagebox.showinfo("Delete Complete", f"{count} logs deleted.")
             self._populate_logs()
-        except Exception as e:
-            messagebox.showerror("Delete Error", f"Failed to delete logs:\n{e}")
+
+        self._run_in_background(
+            lambda: self.controller.delete_logs(older_than),
+            _done, "Delete Error", "Failed to delete logs",
+        )
 
     def _on_export(self):
         """
-        Export the currently displayed logs to a JSON file.
+        Export the current (filtered) result set to a JSON file: the displayed
+        columns, as before (indent=4, key "user"), but all matching rows.
         """
+        from tkinter import filedialog, messagebox
         file_path = filedialog.asksaveasfilename(
             defaultextension=".json",
             filetypes=[("JSON files", "*.json")],
@@ -265,44 +467,85 @@ class LogView(ttk.Frame):
         )
         if not file_path:
             return
-        logs = []
-        for iid in self.tree.get_children():
-            vals = self.tree.item(iid)["values"]
-            logs.append(
-                {
-                    "timestamp": vals[0],
-                    "user": vals[1],
-                    "feature": vals[2],
-                    "event": vals[3],
-                    "reference_id": vals[4],
-                    "message": vals[5],
-                    "log_level": vals[6],
-                }
-            )
+        filters = dict(self._filters)
+        self._run_in_background(
+            lambda: self.controller.export_filtered_logs(
+                file_path, transform=self._export_rows, **filters
+            ),
+            lambda count: messagebox.showinfo("Export Successful", f"{count} logs exported to {file_path}"),
+            "Export Error", "Failed to export logs",
+        )
+
+    # ---------------------------------------------------------------------
+    # Hintergrund-Aktionen
+    # ---------------------------------------------------------------------
+
+    def _run_in_background(
+        self,
+        task: Callable[[], Any],
+        on_done: Callable[[Any], None],
+        error_title: str,
+        error_text: str,
+    ) -> None:
+        """
+        Run *task* on the worker thread while an indeterminate progress bar
+        spins. *on_done* (or the error dialog) runs back on the Tk thread.
+        Only one action runs at a time; further clicks are ignored, refreshes
+        and scrolling wait until it is done (see _defer_while_pending).
+        """
+        if self._pending is not None:
+            return
+        self._progress.pack(side=tk.RIGHT, padx=2)
+        self._progress.start(10)
+        self._pending = self._executor.submit(task)
+        self._poll_pending(on_done, error_title, error_text)
+
+    def _defer_while_pending(self) -> bool:
+        """
+        True, solange eine Hintergrund-Aktion läuft. Archivieren/Löschen halten
+        die Schreibsperre des Loggers; jede Abfrage aus dem Tk-Thread würde
+        bis zum Ende blockieren. Stattdessen wird danach einmal neu geladen.
+        """
+        if self._pending is None:
+            return False
+        self._refresh_deferred = True
+        return True
+
+    def _poll_pending(self, on_done, error_title: str, error_text: str) -> None:
+        # Tk ist nicht thread-sicher: das Future wird vom Tk-Thread aus abgefragt
+        future = self._pending
+        if future is None:
+            return
+        if not future.done():
+            self.after(_POLL_MS, self._poll_pending, on_done, error_title, error_text)
+            return
+        self._pending = None
+        self._progress.stop()
+        self._progress.pack_forget()
         try:
-            self.controller.export_logs_to_json(logs, file_path)
-            messagebox.showinfo("Export Successful", f"Logs exported to {file_path}")
+            result = future.result()
         except Exception as e:
-            messagebox.showerror("Export Error", f"Failed to export logs:\n{e}")
+            from tkinter import messagebox
+            messagebox.showerror(error_title, f"{error_text}:\n{e}")
+        else:
+            on_done(result)
+        if self._refresh_deferred:  # on_done() hat ggf. schon neu geladen
+            self._populate_logs()
+
+    def destroy(self):
+        if getattr(self, "_refresh_after_id", None) is not None:
+            self._cancel_scheduled_refresh()
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+        super().destroy()
 
     def _on_print(self):
         """
-        Print the currently displayed logs in a formatted text view.
+        Print the current (filtered) result set in a formatted text view.
         """
-        logs = []
-        for iid in self.tree.get_children():
-            vals = self.tree.item(iid)["values"]
-            logs.append(
-                {
-                    "timestamp": vals[0],
-                    "username": vals[1],
-                    "feature": vals[2],
-                    "event": vals[3],
-                    "reference_id": vals[4],
-                    "message": vals[5],
-                    "log_level": vals[6],
-                }
-            )
+        from tkinter import messagebox
+        logs = [dict(zip(_PRINT_KEYS, v)) for v in self._rows_to_values(self._all_logs())]
         try:
             self.controller.print_logs(logs)
         except Exception as e:
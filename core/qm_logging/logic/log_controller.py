@@ -1,22 +1,25 @@
 """
 log_controller.py
 
-Erweiterte Version mit Null-sicherer Sortierung.
+Erweiterte Version mit Sortierung und Paging in SQL.
 """
 
 from __future__ import annotations
 
-import json
-import tempfile
 from datetime import datetime, date, timezone
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
 
 from core.qm_logging.logic.logger import logger
 from core.qm_logging.logic import log_export_utils
 from core.qm_logging.models.log_entry import LogEntry
 
 
+# Einträge pro bulk_as_dict()-Aufruf beim Streamen
+_STREAM_CHUNK = 256
+
+
 class LogController:
     """High-level Business-Logic für Logs."""
 
@@ -40,6 +43,7 @@ class LogController:
     # Öffentliche API                                                    #
     # ------------------------------------------------------------------ #
     def set_sorting(self, column: str, ascending: bool) -> None:
+        """Sortierung für get_logs(); *column* muss eine Log-Spalte sein."""
         self._sort_column = column
         self._sort_ascending = ascending
 
@@ -66,6 +70,7 @@ class LogController:
         user_id: Optional[int] = None,
         username: Optional[str] = None,
         limit: Optional[int] = None,
+        offset: int = 0,
     ) -> List[Dict[str, Any]]:
         # --- Filterwerte merken ----------------------------------------
         self.filter_user_id = user_id
@@ -80,50 +85,123 @@ class LogController:
         if limit is None:
             limit = self.limit
 
+        # Filter, Sortierung (NULL zuerst bei ASC) und Paging macht SQLite
         raw: List[LogEntry] = logger.query_logs(
-            user_id=user_id,
-            username=username,
-            feature=feature,
-            event=event,
-            reference_id=reference_id,
-            level=log_level,
-            start_time=self._date_to_iso(start_date, True) if start_date else None,
-            end_time=self._date_to_iso(end_date, False) if end_date else None,
+            **self._logger_filters(
+                start_date, end_date, feature, event, reference_id,
+                log_level, user_id, username,
+            ),
+            sort_column=self._sort_column,
+            sort_ascending=self._sort_ascending,
+            offset=offset,
             limit=limit,
         )
 
-        # --- Null-sichere Sortierung -----------------------------------
-        def _safe_key(entry: LogEntry):
-            if self._sort_column == "timestamp":
-                return entry.timestamp or datetime.min
-            val = getattr(entry, self._sort_column, "")
-            return val if val is not None else ""
+        # --- Dicts für GUI ---------------------------------------------
+        return LogEntry.bulk_as_dict(raw)
 
-        raw_sorted = sorted(raw, key=_safe_key, reverse=not self._sort_ascending)
+    def count_logs(
+        self,
+        *,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        feature: Optional[str] = None,
+        event: Optional[str] = None,
+        reference_id: Optional[str] = None,
+        log_level: Optional[str] = None,
+        user_id: Optional[int] = None,
+        username: Optional[str] = None,
+    ) -> int:
+        """Gesamtzahl der Treffer für dieselben Filter wie :meth:`get_logs`."""
+        return logger.count_logs(
+            **self._logger_filters(
+                start_date, end_date, feature, event, reference_id,
+                log_level, user_id, username,
+            )
+        )
 
-        # --- Dicts für GUI ---------------------------------------------
-        return [e.as_dict() for e in raw_sorted]
+    @staticmethod
+    def _iter_dicts(entries: Iterator[LogEntry]) -> Iterator[Dict[str, Any]]:
+        """LogEntry-Strom → GUI-/Export-Dicts, formatiert in Blöcken."""
+        while True:
+            chunk = list(islice(entries, _STREAM_CHUNK))
+            if not chunk:
+                return
+            yield from LogEntry.bulk_as_dict(chunk)
+
+    def stream_logs(self, **filters) -> Iterator[Dict[str, Any]]:
+        """
+        Komplettes Ergebnis für *filters* (Namen wie bei :meth:`get_logs`)
+        als GUI-/Export-Dicts – direkt aus dem SQLite-Cursor, ohne Limit
+        und ohne Zwischenliste.
+        """
+        entries = logger.iter_logs(
+            **self._logger_filters(**filters),
+            sort_column=self._sort_column,
+            sort_ascending=self._sort_ascending,
+            limit=-1,  # SQLite: kein Limit
+        )
+        return self._iter_dicts(entries)
+
+    def export_filtered_logs(
+        self,
+        file_path: str | Path,
+        *,
+        transform: Optional[Callable[[Iterable[Dict[str, Any]]], Iterable[Dict[str, Any]]]] = None,
+        **filters,
+    ) -> int:
+        """
+        Exportiert alle Treffer für *filters* als JSON; gibt die Anzahl zurück.
+        *transform* formt den Dict-Strom vorher um (z. B. auf die GUI-Spalten).
+        """
+        rows = self.stream_logs(**filters)
+        if transform is not None:
+            rows = transform(rows)
+        return log_export_utils.stream_logs_to_json(rows, file_path)
 
     # ------------------------------------------------------------------ #
     # Archiv / Delete (unverändert)                                      #
     # ------------------------------------------------------------------ #
     def archive_logs(self, older_than: date, file_path: str | Path) -> int:
-        candidates = self._query_older_than(older_than)
-        if not candidates:
-            return 0
-        log_export_utils.export_logs_to_json([c.as_dict() for c in candidates],
-                                             str(file_path))
-        self._delete_logs_in_db({c.id for c in candidates})
-        return len(candidates)
+        """Export + Löschen in einer Transaktion (siehe Logger.archive_older_than)."""
+        end_ts = self._date_to_iso(older_than, True)
+        return logger.archive_older_than(
+            end_ts,
+            lambda entries: log_export_utils.stream_logs_to_json(
+                self._iter_dicts(entries), file_path
+            ),
+        )
 
     def delete_logs(self, older_than: date) -> int:
-        candidates = self._query_older_than(older_than)
-        self._delete_logs_in_db({c.id for c in candidates})
-        return len(candidates)
+        return logger.delete_older_than(self._date_to_iso(older_than, True))
 
     # ------------------------------------------------------------------ #
     # Hilfsfunktionen                                                    #
     # ------------------------------------------------------------------ #
+    @classmethod
+    def _logger_filters(
+        cls,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        feature: Optional[str] = None,
+        event: Optional[str] = None,
+        reference_id: Optional[str] = None,
+        log_level: Optional[str] = None,
+        user_id: Optional[int] = None,
+        username: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """GUI-Filter → Keyword-Argumente für Logger.query_logs/count_logs."""
+        return {
+            "user_id": user_id,
+            "username": username,
+            "feature": feature,
+            "event": event,
+            "reference_id": reference_id,
+            "level": log_level,
+            "start_time": cls._date_to_iso(start_date, True) if start_date else None,
+            "end_time": cls._date_to_iso(end_date, False) if end_date else None,
+        }
+
     @staticmethod
     def _date_to_iso(d: date | None, start_of_day: bool) -> str:
         if d is None:
@@ -131,32 +209,14 @@ class LogController:
         t = datetime.min.time() if start_of_day else datetime.max.time()
         return datetime.combine(d, t, tzinfo=timezone.utc).isoformat()
 
-    def _query_older_than(self, older_than: date) -> List[LogEntry]:
-        end_ts = self._date_to_iso(older_than, True)
-        return logger.query_logs(end_time=end_ts, limit=10_000_000)
-
-    @staticmethod
-    def _delete_logs_in_db(ids: set[int | None]) -> None:
-        real_ids = {i for i in ids if i is not None}
-        if not real_ids:
-            return
-        q = ",".join("?" * len(real_ids))
-        with logger.connect() as conn:
-            conn.execute(f"DELETE FROM logs WHERE id IN ({q})", tuple(real_ids))
-            conn.commit()
     # ------------------------------------------------------------------ #
     # Export / Print  (optional)                                         #
     # ------------------------------------------------------------------ #
     @staticmethod
     def export_logs_to_json(logs: List[Dict[str, Any]], file_path: str | Path) -> None:
-        with open(file_path, "w", encoding="utf-8") as fh:
-            json.dump(logs, fh, indent=4, ensure_ascii=False)
+        log_export_utils.export_logs_to_json(logs, file_path)
 
     @staticmethod
     def print_logs(logs: List[Dict[str, Any]]) -> None:
-        tmp = tempfile.NamedTemporaryFile(
-            mode="w", delete=False, suffix=".json", encoding="utf-8"
-        )
-        json.dump(logs, tmp, indent=4, ensure_ascii=False)
-        tmp.close()
-        log_export_utils.print_file(tmp.name)
+        tmp = log_export_utils.dump_logs_to_temp_json(logs)
+        log_export_utils.print_file(str(tmp))
@@ -4,7 +4,13 @@ log_export_utils.py
 Minimal-Variante: nur noch Export in eine JSON-Datei.
 
 • export_logs_to_json(logs, filepath)
+• stream_logs_to_json(rows, filepath)  → schreibt ein Iterable zeilenweise
 • dump_logs_to_temp_json(logs)         → gibt den Temp-Pfad zurück
+
+Dateiexporte sind wie bisher UTF-8 und mit 4 Leerzeichen eingerückt
+(Standardbibliothek, unabhängig davon, ob ``orjson`` installiert ist); der
+Stream schreibt byte-gleich zu export_logs_to_json(list(rows)). Nur die
+kompakte Variante (``pretty=False``) nutzt ``orjson``, falls vorhanden.
 """
 
 from __future__ import annotations
@@ -12,20 +18,58 @@ from __future__ import annotations
 import json
 import tempfile
 from pathlib import Path
-from typing import List
+from typing import Iterable, List
+
+from core.helpers.json_helper import dumps_bytes
+
+
+# Schreibpuffer für Exporte (1 MiB)
+_WRITE_BUFFER = 1 << 20
+
+
+def _encode(obj: object, *, pretty: bool = False) -> bytes:
+    """JSON → UTF-8-Bytes; kompakt per orjson (falls vorhanden), *pretty* immer mit indent=4."""
+    if pretty:
+        # orjson kennt nur 2er-Einrückung → Format der Exporte bleibt stabil
+        return json.dumps(obj, indent=4, ensure_ascii=False).encode("utf-8")
+    return dumps_bytes(obj)
 
 
 def export_logs_to_json(logs: List[dict], filepath: str | Path) -> None:
     """Write *logs* to *filepath* as UTF-8 JSON (pretty-printed)."""
-    with open(filepath, "w", encoding="utf-8") as fh:
-        json.dump(logs, fh, indent=4, ensure_ascii=False)
+    with open(filepath, "wb") as fh:
+        fh.write(_encode(logs, pretty=True))
+
+
+def stream_logs_to_json(rows: Iterable[dict], filepath: str | Path, *, pretty: bool = True) -> int:
+    """
+    Write *rows* to *filepath* as a UTF-8 JSON array. *rows* is consumed
+    lazily, so peak memory does not grow with the number of exported entries.
+    With *pretty* the file is identical to :func:`export_logs_to_json`,
+    otherwise one compact object per line. Returns the number of rows written.
+    """
+    count = 0
+    with open(filepath, "wb", buffering=_WRITE_BUFFER) as fh:
+        write = fh.write
+        write(b"[")
+        for row in rows:
+            write(b",\n" if count else b"\n")
+            if pretty:
+                # Objekt eine Ebene tiefer einrücken – wie json.dumps(liste, indent=4);
+                # Zeilenumbrüche in Strings sind escaped, \n ist hier immer Struktur
+                write(b"    " + _encode(row, pretty=True).replace(b"\n", b"\n    "))
+            else:
+                write(_encode(row))
+            count += 1
+        write(b"\n]" if count else b"]")
+        if not pretty:
+            write(b"\n")
+    return count
 
 
 def dump_logs_to_temp_json(logs: List[dict]) -> Path:
     """Create a temp JSON file (for mail attachments, bug reports, …)."""
-    tmp = tempfile.NamedTemporaryFile(
-        mode="w", suffix=".json", delete=False, encoding="utf-8"
-    )
-    json.dump(logs, tmp, indent=4, ensure_ascii=False)
+    tmp = tempfile.NamedTemporaryFile(mode="wb", suffix=".json", delete=False)
+    tmp.write(_encode(logs, pretty=True))
     tmp.close()
     return Path(tmp.name)
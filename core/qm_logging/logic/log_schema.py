@@ -0,0 +1,59 @@
+"""
+core/qm_logging/logic/log_schema.py
+===================================
+
+Gemeinsames Schema der Logging-DB (Tabelle ``logs`` + Indizes).
+
+Wird von :class:`Logger` und :class:`LoggerRepository` benutzt; bewusst ohne
+Abhängigkeit zum Logger, damit der Import keinen Singleton/Schreib-Thread
+erzeugt.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+CREATE_LOGS_SQL = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        user_id INTEGER,
+        username TEXT,
+        feature TEXT NOT NULL,
+        event TEXT NOT NULL,
+        reference_id TEXT,
+        message TEXT,
+        log_level INTEGER NOT NULL DEFAULT 6   -- LogLevel (Syslog-Code)
+    )
+"""
+
+# ISO-8601-UTC-Zeitstempel sortieren lexikografisch = chronologisch;
+# id am Ende deckt den Tie-Breaker aus iter_logs() ab (kein Temp-B-Tree)
+LOG_INDEXES = (
+    ("idx_logs_ts",
+     "CREATE INDEX IF NOT EXISTS idx_logs_ts ON logs(timestamp DESC, id DESC)"),
+    ("idx_logs_feat_ts",
+     "CREATE INDEX IF NOT EXISTS idx_logs_feat_ts ON logs(feature, timestamp DESC, id DESC)"),
+    ("idx_logs_event_ts",
+     "CREATE INDEX IF NOT EXISTS idx_logs_event_ts ON logs(event, timestamp DESC, id DESC)"),
+    ("idx_logs_level_ts",
+     "CREATE INDEX IF NOT EXISTS idx_logs_level_ts ON logs(log_level, timestamp DESC, id DESC)"),
+    ("idx_logs_ref",
+     "CREATE INDEX IF NOT EXISTS idx_logs_ref ON logs(reference_id)"),
+)
+
+
+def ensure_indexes(conn: sqlite3.Connection) -> None:
+    """Indizes für Filter + ORDER BY timestamp; ANALYZE nur beim ersten Anlegen."""
+    existing = {
+        r[0]
+        for r in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'logs'"
+        )
+    }
+    missing = [sql for name, sql in LOG_INDEXES if name not in existing]
+    if not missing:
+        return
+    for sql in missing:
+        conn.execute(sql)
+    conn.execute("ANALYZE logs")
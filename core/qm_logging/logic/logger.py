@@ -8,21 +8,122 @@ Auto-Fill des Benutzernamens, falls nicht explizit angegeben.
 
 from __future__ import annotations
 
+import atexit
+import collections
+import functools
 import os
+import queue
+import sqlite3
+import sys
 import threading
-from datetime import datetime, timezone
+import time
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from core.config.config_loader import config_loader
 from core.common.db_interface import DatabaseAccess, create_sqlite_connection
-from core.qm_logging.models.log_entry import LogEntry
+from core.helpers.date_time_helper import utc_now_iso_us
+from core.qm_logging.logic.log_schema import CREATE_LOGS_SQL, ensure_indexes
+from core.qm_logging.models.log_entry import ROW_COLUMNS, LogEntry
+from core.qm_logging.models.log_level import LogLevel
 
 # --------------------------------------------------------------------------- #
 #  Pfad zur Logging-Datenbank                                                 #
 # --------------------------------------------------------------------------- #
 LOG_DB_PATH: Path = config_loader.get_logging_db_path()
 
+# Wiederholversuche, wenn ein anderer Prozess gerade schreibt (SQLITE_BUSY)
+_BUSY_RETRIES = 5
+_BUSY_BACKOFF_S = 0.05
+# Primäre Result-Codes (sqlite3.SQLITE_BUSY/SQLITE_LOCKED gibt es erst ab 3.11)
+_BUSY_CODES = frozenset({
+    getattr(sqlite3, "SQLITE_BUSY", 5),
+    getattr(sqlite3, "SQLITE_LOCKED", 6),
+})
+
+# Hintergrund-Schreiber: max. Zeilen bzw. Wartezeit pro Transaktion
+_BATCH_SIZE = 500
+_BATCH_INTERVAL_S = 0.1
+_STOP = object()
+
+# Statement-Cache der Verbindung: deckt alle Filter-/Sortier-Kombinationen
+# ab, die die GUI typischerweise erzeugt (siehe _query_sql)
+_CACHED_STATEMENTS = 256
+
+# Größe des In-Memory-Schwanzes (Logger.entries / recent())
+_RECENT_MAX = 1024
+
+# Zeilen pro fetchmany() beim Streamen von Abfragen
+_FETCH_ARRAYSIZE = 256
+
+_SELECT_COLUMNS = ", ".join(ROW_COLUMNS)
+
+# Erlaubte ORDER-BY-Spalten (Whitelist, da nicht parametrisierbar)
+_SORT_COLUMNS = frozenset({
+    "id", "timestamp", "user_id", "username", "feature", "event",
+    "reference_id", "message", "log_level",
+})
+
+# WAL: Leser blockieren den Schreiber nicht; NORMAL spart fsyncs pro Commit
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
+
+_INSERT_SQL = """
+    INSERT INTO logs
+        (timestamp, user_id, username, feature, event,
+         reference_id, message, log_level)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_DELETE_ALL_SQL = "DELETE FROM logs"
+_DELETE_BY_ID_SQL = "DELETE FROM logs WHERE id = ?"
+_DELETE_OLDER_SQL = "DELETE FROM logs WHERE timestamp <= ?"
+_SELECT_OLDER_SQL = (
+    f"SELECT {_SELECT_COLUMNS} FROM logs WHERE timestamp <= ? ORDER BY timestamp, id"
+)
+
+
+# --------------------------------------------------------------------------- #
+#  SQL-Bausteine (gecacht)                                                    #
+# --------------------------------------------------------------------------- #
+#  Gleiche Filterkombination + Sortierung → identischer SQL-Text. Damit trifft
+#  der Statement-Cache der (langlebigen) Verbindung und SQLite muss die Abfrage
+#  nicht neu kompilieren. Bewusst kein "(? IS NULL OR col = ?)"-Einheits-
+#  template: damit könnte der Planer die Indizes nicht mehr nutzen.
+def _where_sql(clauses: Tuple[str, ...]) -> str:
+    return " WHERE " + " AND ".join(clauses) if clauses else ""
+
+
+@functools.lru_cache(maxsize=512)
+def _query_sql(clauses: Tuple[str, ...], sort_column: str, ascending: bool) -> str:
+    direction = "ASC" if ascending else "DESC"
+    # id als Tie-Breaker, damit das Paging stabil bleibt
+    return (
+        f"SELECT {_SELECT_COLUMNS} FROM logs{_where_sql(clauses)}"
+        f" ORDER BY {sort_column} {direction}, id {direction}"
+        " LIMIT ? OFFSET ?"
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _count_sql(clauses: Tuple[str, ...]) -> str:
+    return f"SELECT COUNT(*) FROM logs{_where_sql(clauses)}"
+
+
+def _is_busy(exc: sqlite3.Error) -> bool:
+    """SQLITE_BUSY/SQLITE_LOCKED (auch erweiterte Codes wie BUSY_SNAPSHOT)?"""
+    code = getattr(exc, "sqlite_errorcode", None)
+    if code is not None:
+        return code & 0xFF in _BUSY_CODES
+    # Python < 3.11: kein Fehlercode am Exception-Objekt
+    msg = str(exc)
+    return "locked" in msg or "busy" in msg
+
 
 # --------------------------------------------------------------------------- #
 #  Singleton-Klasse                                                           #
@@ -32,31 +133,55 @@ class Logger(DatabaseAccess):
 
     _instance: "Logger | None" = None
     _instance_lock = threading.Lock()
+    _initialized = False
 
-    def __new__(cls) -> "Logger":  # noqa: D401
-        if cls._instance is None:
-            with cls._instance_lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False  # type: ignore[attr-defined]
-        return cls._instance  # type: ignore[return-value]
+    def __new__(cls, db_path: Optional[Path] = None) -> "Logger":  # noqa: D401
+        # Eigener Pfad → eigenständige Instanz (Tests, Werkzeuge)
+        if db_path is not None:
+            return super().__new__(cls)
+        # Fast Path ohne Lock; der Lock schützt nur die allererste Erzeugung.
+        # Regulär wird ohnehin nur das Modul-Singleton ``logger`` benutzt.
+        inst = cls._instance
+        if inst is not None:
+            return inst
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+            return cls._instance
 
-    def __init__(self) -> None:
-        if getattr(self, "_initialized", False):
+    def __init__(self, db_path: Optional[Path] = None) -> None:
+        if self._initialized:
             return
         self._initialized = True
 
-        self._lock = threading.Lock()
-        self._db_path: Path = LOG_DB_PATH
-        self.entries: list[LogEntry] = []
-        self._ensure_db()
+        # RLock: insert_many() darf einen iter_logs()-Generator konsumieren
+        self._lock = threading.RLock()
+        self._db_path: Path = Path(db_path) if db_path is not None else LOG_DB_PATH
+        # Nur ein begrenzter Schwanz der Einträge dieses Prozesses im RAM
+        self.entries: "collections.deque[LogEntry]" = collections.deque(maxlen=_RECENT_MAX)
+        self._open()
+
+        # log() reiht nur ein; ein einzelner Thread schreibt in Batches
+        # (eine Transaktion pro Batch, Reihenfolge bleibt erhalten).
+        self._queue: "queue.SimpleQueue[object]" = queue.SimpleQueue()
+        self._writer_thread = threading.Thread(
+            target=self._writer_loop, name="qm-logger-writer", daemon=True
+        )
+        self._writer_thread.start()
+        atexit.register(self.shutdown)
 
     @property
     def db_path(self) -> Path:
         return self._db_path
 
-    def connect(self):
-        return create_sqlite_connection(self._db_path)
+    def connect(self) -> sqlite3.Connection:
+        """
+        Liefert die langlebige Verbindung des Loggers (Autocommit-Modus).
+
+        Lesezugriffe laufen ohne implizite Transaktion; Schreibzugriffe
+        öffnen ihre Transaktion explizit über :meth:`_write`.
+        """
+        return self._conn
 
     # ------------------------------------------------------------------ #
     #  Öffentliche API: log                                              #
@@ -68,7 +193,7 @@ class Logger(DatabaseAccess):
         *,
         user_id: Optional[int] = None,
         username: Optional[str] = None,
-        level: str = "INFO",
+        level: LogLevel | int | str = LogLevel.INFO,
         reference_id: Optional[str] = None,
         message: Optional[str] = None,
     ) -> None:
@@ -88,7 +213,7 @@ class Logger(DatabaseAccess):
             except Exception:  # pragma: no cover
                 pass
 
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = utc_now_iso_us()
         entry = LogEntry(
             id=None,
             timestamp=timestamp,
@@ -98,131 +223,360 @@ class Logger(DatabaseAccess):
             event=event,
             reference_id=reference_id,
             message=message,
-            log_level=level,
+            log_level=LogLevel.coerce(level, LogLevel.INFO).name,
         )
 
         self.entries.append(entry)
-        self._insert_log(entry)
+        if self._writer_thread.is_alive():
+            self._queue.put_nowait(self._entry_params(entry))
+        else:  # nach shutdown(): synchron schreiben
+            self._insert_log(entry)
+
+    def flush(self) -> None:
+        """Blockiert, bis alle bisher eingereihten Einträge geschrieben sind."""
+        if not self._writer_thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put_nowait(done)
+        done.wait()
+
+    def shutdown(self) -> None:
+        """Restliche Einträge schreiben und den Schreib-Thread beenden."""
+        if self._writer_thread.is_alive():
+            self._queue.put_nowait(_STOP)
+            self._writer_thread.join()
 
     # ------------------------------------------------------------------ #
     #  Fetch / Query / Clear                                             #
     # ------------------------------------------------------------------ #
+    def recent(self, n: int = 100) -> List[LogEntry]:
+        """
+        Die letzten *n* (max. ``_RECENT_MAX``) Einträge dieses Prozesses,
+        neueste zuerst – ohne SQLite. Für die vollständige Historie
+        :meth:`fetch_logs` verwenden.
+        """
+        entries = self.entries
+        return [entries[-i] for i in range(1, min(n, len(entries)) + 1)]
+
     def fetch_logs(self, limit: int = 100) -> List[LogEntry]:
-        with self.connect() as conn:
-            c = conn.cursor()
-            c.execute(
-                "SELECT * FROM logs ORDER BY timestamp DESC LIMIT ?", (limit,)
-            )
-            rows = c.fetchall()
-            return [
-                LogEntry.from_dict(dict(zip([col[0] for col in c.description], row)))
-                for row in rows
-            ]
+        return list(self.iter_logs(limit=limit))
+
+    def query_logs(self, **filters) -> List[LogEntry]:
+        """Wie :meth:`iter_logs`, liefert aber eine fertige Liste."""
+        return list(self.iter_logs(**filters))
 
-    def query_logs(
+    def iter_logs(
         self,
+        *,
+        sort_column: str = "timestamp",
+        sort_ascending: bool = False,
+        offset: int = 0,
+        limit: int = 1_000,
+        **filters,
+    ) -> Iterator[LogEntry]:
+        """
+        Streamt passende Einträge direkt aus dem Cursor.
+
+        Filter (siehe :meth:`_where`), Sortierung und Paging (``LIMIT`` /
+        ``OFFSET``) laufen komplett in SQLite. Es wird nie das ganze
+        Ergebnis auf einmal materialisiert – Export und GUI können damit
+        auch große Zeiträume mit O(1) Zusatzspeicher verarbeiten.
+        """
+        if sort_column not in _SORT_COLUMNS:
+            raise ValueError(f"Unsupported sort column: {sort_column!r}")
+        # Bewusst kein Generator: flush() läuft sofort beim Aufruf. Im
+        # Generator liefe es erst beim ersten next() – z. B. innerhalb von
+        # insert_many(), das dann _lock hält, den der Schreib-Thread braucht.
+        self.flush()  # eigene, noch eingereihte Einträge sichtbar machen
+        clauses, params = self._where(**filters)
+        query = _query_sql(clauses, sort_column, bool(sort_ascending))
+        params.extend((limit, offset))
+        return self._iter_rows(query, params)
+
+    def _iter_rows(self, query: str, params: Sequence[object]) -> Iterator[LogEntry]:
+        from_row = LogEntry.from_row
+        # Lock nur um execute/fetchmany, nie über ein yield hinweg
+        with self._lock:
+            c = self._conn.cursor()
+            c.row_factory = None  # schlichte Tupel für LogEntry.from_row
+            c.arraysize = _FETCH_ARRAYSIZE
+            c.execute(query, params)
+        try:
+            while True:
+                with self._lock:
+                    rows = c.fetchmany()
+                if not rows:
+                    break
+                yield from map(from_row, rows)
+        finally:
+            c.close()
+
+    def count_logs(self, **filters) -> int:
+        """Anzahl Einträge für dieselben Filter wie :meth:`iter_logs`."""
+        clauses, params = self._where(**filters)
+        self.flush()
+        with self._lock:
+            return self._conn.execute(_count_sql(clauses), params).fetchone()[0]
+
+    @staticmethod
+    def _where(
         *,
         user_id: Optional[int] = None,
         username: Optional[str] = None,
         feature: Optional[str] = None,
         event: Optional[str] = None,
         reference_id: Optional[str] = None,
-        level: Optional[str] = None,
+        level: LogLevel | int | str | None = None,
         start_time: Optional[str] = None,
         end_time: Optional[str] = None,
-        limit: int = 1_000,
-    ) -> List[LogEntry]:
-        with self.connect() as conn:
-            c = conn.cursor()
-
-            query = "SELECT * FROM logs WHERE 1=1"
-            params: list[object] = []
-
-            if user_id is not None:
-                query += " AND user_id = ?"
-                params.append(user_id)
-            if username is not None:
-                query += " AND username = ?"
-                params.append(username)
-            if feature is not None:
-                query += " AND feature = ?"
-                params.append(feature)
-            if event is not None:
-                query += " AND event = ?"
-                params.append(event)
-            if reference_id is not None:
-                query += " AND reference_id = ?"
-                params.append(reference_id)
-            if level is not None:
-                query += " AND log_level = ?"
-                params.append(level)
-            if start_time is not None:
-                query += " AND timestamp >= ?"
-                params.append(start_time)
-            if end_time is not None:
-                query += " AND timestamp <= ?"
-                params.append(end_time)
-
-            query += " ORDER BY timestamp DESC LIMIT ?"
-            params.append(limit)
+    ) -> Tuple[Tuple[str, ...], List[object]]:
+        """
+        Aktive Filterbedingungen + Parameter; ``None`` bedeutet „nicht filtern“.
 
-            c.execute(query, params)
-            rows = c.fetchall()
+        Die Bedingungen kommen als Tupel zurück, damit daraus per Cache immer
+        derselbe SQL-Text entsteht (siehe :func:`_query_sql`).
+        """
+        clauses: list[str] = []
+        params: list[object] = []
+
+        if user_id is not None:
+            clauses.append("user_id = ?")
+            params.append(user_id)
+        if username is not None:
+            clauses.append("username = ?")
+            params.append(username)
+        if feature is not None:
+            clauses.append("feature = ?")
+            params.append(feature)
+        if event is not None:
+            clauses.append("event = ?")
+            params.append(event)
+        if reference_id is not None:
+            clauses.append("reference_id = ?")
+            params.append(reference_id)
+        if level is not None:
+            clauses.append("log_level = ?")
+            params.append(int(LogLevel.coerce(level)))
+        if start_time is not None:
+            clauses.append("timestamp >= ?")
+            params.append(start_time)
+        if end_time is not None:
+            clauses.append("timestamp <= ?")
+            params.append(end_time)
 
-            return [
-                LogEntry.from_dict(dict(zip([col[0] for col in c.description], row)))
-                for row in rows
-            ]
+        return tuple(clauses), params
+
+    def insert_many(self, entries: Iterable[LogEntry]) -> None:
+        """Massenimport (z. B. Archiv zurückspielen) in einer Transaktion."""
+        self._write(_INSERT_SQL, (self._entry_params(e) for e in entries))
 
     def clear_logs(self) -> None:
-        with self.connect() as conn:
-            conn.cursor().execute("DELETE FROM logs")
-            conn.commit()
+        self.flush()
+        self._write(_DELETE_ALL_SQL, [()])
+
+    def delete_logs_by_id(self, ids: Iterable[int]) -> None:
+        self._write(_DELETE_BY_ID_SQL, [(i,) for i in ids])
+
+    def delete_older_than(self, end_time: str) -> int:
+        """Löscht alle Einträge mit ``timestamp <= end_time``; gibt die Anzahl zurück."""
+        self.flush()
+        with self._lock:
+            conn = self._conn
+            self._begin_immediate(conn)
+            try:
+                deleted = conn.execute(_DELETE_OLDER_SQL, (end_time,)).rowcount
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        return deleted
+
+    def archive_older_than(
+        self,
+        end_time: str,
+        sink: Callable[[Iterator[LogEntry]], object],
+    ) -> int:
+        """
+        Archiviert alle Einträge mit ``timestamp <= end_time`` atomar:
+        SELECT → *sink* (z. B. JSON-Export) → DELETE in **einer**
+        ``BEGIN IMMEDIATE``-Transaktion.
+
+        *sink* bekommt einen Generator direkt auf dem Cursor (O(1) Speicher).
+        Da die Schreibsperre während der ganzen Transaktion gehalten wird,
+        kann niemand dazwischen schreiben – das DELETE mit demselben Prädikat
+        trifft genau die exportierten Zeilen, ohne ID-Liste. Schlägt *sink*
+        fehl oder liest nicht alles, wird zurückgerollt.
+        """
+        self.flush()
+        exported = 0
+        with self._lock:
+            conn = self._conn
+            self._begin_immediate(conn)
+            try:
+                c = conn.cursor()
+                c.row_factory = None
+                c.arraysize = _FETCH_ARRAYSIZE
+                c.execute(_SELECT_OLDER_SQL, (end_time,))
+
+                def _entries() -> Iterator[LogEntry]:
+                    nonlocal exported
+                    from_row = LogEntry.from_row
+                    for rows in iter(c.fetchmany, []):
+                        for row in rows:
+                            yield from_row(row)
+                            exported += 1  # erst zählen, wenn sink weiterliest
+
+                sink(_entries())
+                c.close()
+                deleted = conn.execute(_DELETE_OLDER_SQL, (end_time,)).rowcount
+                if deleted != exported:
+                    raise RuntimeError(
+                        f"Archiv unvollständig: {exported} exportiert, {deleted} zu löschen"
+                    )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        return exported
 
     # ------------------------------------------------------------------ #
     #  Interne Helfer                                                    #
     # ------------------------------------------------------------------ #
-    def _ensure_db(self) -> None:
+    def _open(self) -> None:
+        """Verbindung zu ``self._db_path`` öffnen, tunen und Schema sicherstellen."""
         os.makedirs(self.db_path.parent, exist_ok=True)
-        with self.connect() as conn:
+        # Eine Verbindung für alle Threads (check_same_thread=False ist der
+        # Default von create_sqlite_connection); self._lock schützt nur die
+        # execute()/fetchmany()-Abschnitte.
+        self._conn: sqlite3.Connection = create_sqlite_connection(
+            self._db_path,
+            isolation_level=None,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        for pragma in _PRAGMAS:
+            self._conn.execute(pragma)
+        self._ensure_db()
+
+    def _ensure_db(self) -> None:
+        conn = self._conn
+        conn.execute(CREATE_LOGS_SQL.format(table="logs"))
+        self._migrate_text_levels(conn)
+        ensure_indexes(conn)
+
+    @staticmethod
+    def _migrate_text_levels(conn: sqlite3.Connection) -> None:
+        """Alt-Schema mit ``log_level TEXT`` auf Integer-Codes umstellen."""
+        cols = {r["name"]: r["type"] for r in conn.execute("PRAGMA table_info(logs)")}
+        if cols.get("log_level", "").upper() != "TEXT":
+            return
+        # Gleiche Zuordnung wie zur Laufzeit (Aliasse, Ziffern, Groß/klein);
+        # Unbekanntes wird INFO
+        conn.create_function(
+            "qm_level_code", 1,
+            lambda v: int(LogLevel.coerce(v if v is not None else "", LogLevel.INFO)),
+            deterministic=True,
+        )
+        Logger._begin_immediate(conn)
+        try:
+            conn.execute(CREATE_LOGS_SQL.format(table="logs_new"))
             conn.execute(
                 """
-                CREATE TABLE IF NOT EXISTS logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    user_id INTEGER,
-                    username TEXT,
-                    feature TEXT NOT NULL,
-                    event TEXT NOT NULL,
-                    reference_id TEXT,
-                    message TEXT,
-                    log_level TEXT NOT NULL DEFAULT 'INFO'
-                )
+                INSERT INTO logs_new
+                    (id, timestamp, user_id, username, feature, event,
+                     reference_id, message, log_level)
+                SELECT id, timestamp, user_id, username, feature, event,
+                       reference_id, message,
+                       qm_level_code(log_level)
+                FROM logs
                 """
             )
-            conn.commit()
+            conn.execute("DROP TABLE logs")
+            conn.execute("ALTER TABLE logs_new RENAME TO logs")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _writer_loop(self) -> None:
+        """
+        Hintergrund-Thread: sammelt bis zu ``_BATCH_SIZE`` Zeilen oder
+        ``_BATCH_INTERVAL_S`` lang und schreibt sie mit einem executemany().
+        flush()-Events beenden den Batch sofort.
+        """
+        q = self._queue
+        stop = False
+        while not stop:
+            item = q.get()
+            batch: list[Tuple[object, ...]] = []
+            waiters: list[threading.Event] = []
+            deadline = time.monotonic() + _BATCH_INTERVAL_S
+            while True:
+                if item is _STOP:
+                    stop = True
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                batch.append(item)  # type: ignore[arg-type]
+                timeout = deadline - time.monotonic()
+                if len(batch) >= _BATCH_SIZE or timeout <= 0:
+                    break
+                try:
+                    item = q.get(timeout=timeout)
+                except queue.Empty:
+                    break
+            if batch:
+                try:
+                    self._write(_INSERT_SQL, batch)
+                except Exception as exc:  # Logger darf die App nie abbrechen
+                    print(f"[Logger] {len(batch)} Einträge nicht geschrieben: {exc}",
+                          file=sys.stderr)
+            for w in waiters:
+                w.set()
 
     def _insert_log(self, entry: LogEntry) -> None:
-        with self.connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO logs
-                    (timestamp, user_id, username, feature, event,
-                     reference_id, message, log_level)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    entry.timestamp,
-                    entry.user_id,
-                    entry.username,
-                    entry.feature,
-                    entry.event,
-                    entry.reference_id,
-                    entry.message,
-                    entry.log_level,
-                ),
-            )
-            conn.commit()
+        self._write(_INSERT_SQL, [self._entry_params(entry)])
+
+    @staticmethod
+    def _entry_params(entry: LogEntry) -> Tuple[object, ...]:
+        return (
+            entry.timestamp,
+            entry.user_id,
+            entry.username,
+            entry.feature,
+            entry.event,
+            entry.reference_id,
+            entry.message,
+            int(LogLevel.coerce(entry.log_level, LogLevel.INFO)),
+        )
+
+    def _write(self, sql: str, rows: Iterable[Sequence[object]]) -> None:
+        """
+        Führt *sql* für alle *rows* in genau einer ``BEGIN IMMEDIATE``-
+        Transaktion aus. *rows* darf ein Generator sein – er wird erst
+        innerhalb der Transaktion konsumiert.
+        """
+        with self._lock:
+            conn = self._conn
+            self._begin_immediate(conn)
+            try:
+                conn.executemany(sql, rows)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    @staticmethod
+    def _begin_immediate(conn: sqlite3.Connection) -> None:
+        """Schreibsperre holen; ist die DB gesperrt, mit Backoff erneut versuchen."""
+        for attempt in range(_BUSY_RETRIES):
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                return
+            except sqlite3.OperationalError as exc:
+                if not _is_busy(exc) or attempt == _BUSY_RETRIES - 1:
+                    raise
+                time.sleep(_BUSY_BACKOFF_S * (2 ** attempt))
 
 
 # --------------------------------------------------------------------------- #
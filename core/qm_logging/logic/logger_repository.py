@@ -1,9 +1,15 @@
-from core.qm_logging.models.log_entry import LogEntry
+from core.qm_logging.models.log_entry import ROW_COLUMNS, LogEntry
+from core.qm_logging.models.log_level import LogLevel
+from core.qm_logging.logic.log_schema import CREATE_LOGS_SQL, ensure_indexes
 from core.config.config_loader import config_loader
+from core.config.config_service import config_service
 from core.common.db_interface import SQLiteRepository
 
 logs_db_path = config_loader.get_logging_db_path()
 
+# Feste Spaltenreihenfolge für LogEntry.from_row (statt SELECT * + dict(row))
+_SELECT_COLUMNS = ", ".join(ROW_COLUMNS)
+
 
 class LoggerRepository(SQLiteRepository):
     def __init__(self):
@@ -11,29 +17,18 @@ class LoggerRepository(SQLiteRepository):
         #self.db_path = db_path.parent / "logs.db"
 
         # Optional: Debug-Ausgabe nur wenn aktiviert
-        from core.config.config_loader import config_loader
-       # if config_loader.get_bool("General", "debug_db_paths", False):
-        print(f"[DEBUG] Logger DB ➡ {logs_db_path}")
+        if config_service.general.debug_db_paths:
+            print(f"[DEBUG] Logger DB ➡ {logs_db_path}")
 
         super().__init__(logs_db_path)
+        # Verbindung wird lazy von connect()/self.conn geöffnet (auch nach close())
         self._ensure_db()
 
     def _ensure_db(self):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
-                feature TEXT NOT NULL,
-                event TEXT NOT NULL,
-                user_id INTEGER,
-                username TEXT,
-                reference_id TEXT,
-                message TEXT,
-                log_level TEXT NOT NULL DEFAULT 'INFO'
-            )
-        """)
-        self.conn.commit()
+        conn = self.conn
+        conn.execute(CREATE_LOGS_SQL.format(table="logs"))
+        ensure_indexes(conn)
+        conn.commit()
 
     def insert_log(self, entry: LogEntry):
         cursor = self.conn.cursor()
@@ -49,7 +44,7 @@ class LoggerRepository(SQLiteRepository):
                 entry.username,
                 entry.reference_id,
                 entry.message,
-                entry.log_level,
+                int(LogLevel.coerce(entry.log_level, LogLevel.INFO)),
             )
         )
         self.conn.commit()
@@ -57,15 +52,15 @@ class LoggerRepository(SQLiteRepository):
     def fetch_logs(self, limit=100):
         cursor = self.conn.cursor()
         cursor.execute(
-            "SELECT * FROM logs ORDER BY timestamp DESC LIMIT ?", (limit,)
+            f"SELECT {_SELECT_COLUMNS} FROM logs ORDER BY timestamp DESC LIMIT ?", (limit,)
         )
         rows = cursor.fetchall()
-        return [LogEntry.from_dict(dict(row)) for row in rows]
+        return list(map(LogEntry.from_row, rows))
 
     def query_logs(self, user_id=None, username=None, feature=None, level=None,
                    start_time=None, end_time=None, limit=1000):
         cursor = self.conn.cursor()
-        query = "SELECT * FROM logs WHERE 1=1"
+        query = f"SELECT {_SELECT_COLUMNS} FROM logs WHERE 1=1"
         params = []
 
         if user_id is not None:
@@ -79,7 +74,7 @@ class LoggerRepository(SQLiteRepository):
             params.append(feature)
         if level is not None:
             query += " AND log_level = ?"
-            params.append(level)
+            params.append(int(LogLevel.coerce(level)))
         if start_time is not None:
             query += " AND timestamp >= ?"
             params.append(start_time)
@@ -92,7 +87,7 @@ class LoggerRepository(SQLiteRepository):
 
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        return [LogEntry.from_dict(dict(row)) for row in rows]
+        return list(map(LogEntry.from_row, rows))
 
     def clear_logs(self):
         cursor = self.conn.cursor()
@@ -4,17 +4,22 @@ log_entry.py
 Dataclass für einen Logeintrag.
 
 • from_dict()  – baut das Objekt aus einem DB-/JSON-Dict
+• from_row()   – baut das Objekt positionsbasiert aus einer DB-Zeile
+                 (Spaltenfolge: ROW_COLUMNS)
 • as_dict()    – gibt für die GUI ein Dict mit
                  - timestamp_utc (ISO-UTC)
                  - timestamp      (lokale Europe/Berlin-Zeit)
                  zurück.
+• bulk_as_dict() – wie as_dict(), aber für eine ganze Liste in einem Durchlauf
 """
 
 from __future__ import annotations    # ← muss direkt nach dem Docstring stehen!
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Sequence
+
+from core.qm_logging.models.log_level import level_name
 
 # ------------------------------------------------------------------ #
 # Flexibler Import des Helpers                                       #
@@ -25,6 +30,16 @@ try:
 except ModuleNotFoundError:           # Fallback z. B. bei Unit-Tests
     import date_time_helper as dt
 
+_LOCAL_TZ = dt.LOCAL_TZ
+_LOCAL_FMT = dt.LOCAL_DISPLAY_FMT
+
+
+# Spaltenfolge, die from_row() erwartet (SELECT-Liste im Logger)
+ROW_COLUMNS = (
+    "id", "timestamp", "user_id", "username", "feature",
+    "event", "reference_id", "message", "log_level",
+)
+
 
 @dataclass
 class LogEntry:
@@ -48,7 +63,7 @@ class LogEntry:
         return cls(
             id=data.get("id"),
             timestamp=ts,
-            log_level=data.get("log_level", "INFO"),
+            log_level=level_name(data.get("log_level")),
             user_id=data.get("user_id"),
             username=data.get("username"),
             feature=data.get("feature", ""),
@@ -57,19 +72,39 @@ class LogEntry:
             message=data.get("message"),
         )
 
+    @classmethod
+    def from_row(cls, row: Sequence) -> "LogEntry":
+        """Erzeugt ein LogEntry aus einem Tupel in ROW_COLUMNS-Reihenfolge (ohne Dict)."""
+        id_, ts, user_id, username, feature, event, reference_id, message, level = row
+        if isinstance(ts, str):
+            ts = datetime.fromisoformat(ts)
+        return cls(
+            id_, ts, level_name(level), user_id, username,
+            feature or "", event or "", reference_id, message,
+        )
+
     # -------------------- Dict für GUI / Export ---------------------- #
     def as_dict(self) -> dict:
-        utc_iso = self.timestamp.replace(microsecond=0).isoformat()
-        local_str = dt.utc_to_local_str(utc_iso)  # z. B. '09.07.2025 17:21:03'
-        return {
-            "id": self.id,
-            "timestamp_utc": utc_iso,
-            "timestamp": local_str,
-            "log_level": self.log_level,
-            "user_id": self.user_id,
-            "username": self.username,
-            "feature": self.feature,
-            "event": self.event,
-            "reference_id": self.reference_id,
-            "message": self.message,
-        }
+        return LogEntry.bulk_as_dict((self,))[0]
+
+    @staticmethod
+    def bulk_as_dict(entries: Sequence["LogEntry"]) -> List[dict]:
+        """as_dict() für viele Einträge; Zeitzone/Format werden nur einmal gebunden."""
+        tz, fmt = _LOCAL_TZ, _LOCAL_FMT
+        out: List[dict] = []
+        append = out.append
+        for e in entries:
+            ts = e.timestamp.replace(microsecond=0)
+            append({
+                "id": e.id,
+                "timestamp_utc": ts.isoformat(),
+                "timestamp": ts.astimezone(tz).strftime(fmt),
+                "log_level": e.log_level,
+                "user_id": e.user_id,
+                "username": e.username,
+                "feature": e.feature,
+                "event": e.event,
+                "reference_id": e.reference_id,
+                "message": e.message,
+            })
+        return out
@@ -0,0 +1,69 @@
+"""
+log_level.py
+
+Numerische Log-Level nach Syslog (RFC 5424).
+
+Die Datenbank speichert nur den Integer-Code (1 Byte); GUI, Export und
+LogEntry arbeiten weiterhin mit dem Namen ("INFO", "ERROR", …).
+"""
+
+from __future__ import annotations
+
+from enum import IntEnum
+from typing import Optional, Tuple, Union
+
+
+class LogLevel(IntEnum):
+    EMERGENCY = 0
+    ALERT = 1
+    CRITICAL = 2
+    ERROR = 3
+    WARNING = 4
+    NOTICE = 5
+    INFO = 6
+    DEBUG = 7
+
+    @classmethod
+    def coerce(
+        cls,
+        value: Union["LogLevel", int, str],
+        default: Optional["LogLevel"] = None,
+    ) -> "LogLevel":
+        """
+        Wandelt Name, Code oder LogLevel in ein LogLevel um.
+
+        Unbekannte Werte liefern *default* bzw. ``ValueError``, wenn
+        kein Default angegeben ist.
+        """
+        if isinstance(value, int):
+            if 0 <= value < len(LEVEL_NAMES):
+                return cls(value)
+        elif isinstance(value, str):
+            key = value.strip().upper()
+            if key.isdigit():
+                return cls.coerce(int(key), default)
+            lvl = _BY_NAME.get(key)
+            if lvl is not None:
+                return lvl
+        if default is not None:
+            return default
+        raise ValueError(f"Unknown log level: {value!r}")
+
+
+# Index = Code → Name; O(1)-Lookup beim Lesen aus der DB
+LEVEL_NAMES: Tuple[str, ...] = tuple(lvl.name for lvl in LogLevel)
+
+_BY_NAME = {lvl.name: lvl for lvl in LogLevel}
+_BY_NAME.update({
+    "EMERG": LogLevel.EMERGENCY,
+    "CRIT": LogLevel.CRITICAL,
+    "FATAL": LogLevel.CRITICAL,
+    "WARN": LogLevel.WARNING,
+})
+
+
+def level_name(value: Union[int, str, None]) -> str:
+    """Name zu einem DB-Wert; Alt-Daten (Text) werden durchgereicht."""
+    if isinstance(value, int) and 0 <= value < len(LEVEL_NAMES):
+        return LEVEL_NAMES[value]
+    return value or LogLevel.INFO.name
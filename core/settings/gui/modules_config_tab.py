@@ -12,12 +12,16 @@ Admin-Tab zur Modulverwaltung:
 
 from __future__ import annotations
 
+import ast
 import importlib
+import importlib.util
+import itertools
 import json
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
-from typing import List
 
 from core.common.module_descriptor import ModuleDescriptor
 from core.common.module_registry import invalidate_registry_cache
@@ -25,7 +29,41 @@ from core.common.module_repository import ModuleRepository
 from core.common.module_auto_discovery import default_roots
 from core.qm_logging.logic.logger import logger
 
-ROLES = ["Admin", "QMB", "User"]
+ROLES = ("Admin", "QMB", "User")
+COLUMNS = (
+    "enabled", "label", "sort",
+    *(f"vis_{r}" for r in ROLES),
+    *(f"stg_{r}" for r in ROLES),
+    "license",
+)
+HEADERS = ("On", "Label", "Sort", "Admin", "QMB", "User", "Admin ⚙", "QMB ⚙", "User ⚙", "License")
+_CHECK = {True: "☑", False: "☐"}
+# Abfrageintervall für den laufenden Scan (ms)
+_POLL_MS = 100
+# JSON für jede Rollen-Teilmenge (leer → nur Admin), Reihenfolge wie ROLES
+_ROLES_JSON = {
+    frozenset(combo): json.dumps(list(combo) or ["Admin"])
+    for n in range(len(ROLES) + 1)
+    for combo in itertools.combinations(ROLES, n)
+}
+
+
+def _check_class(module_path: str, class_name: str) -> None:
+    """
+    Prüft, ob *module_path* existiert und *class_name* definiert, möglichst
+    ohne das Modul auszuführen: find_spec + Suche nach der Klasse im
+    Quelltext (AST). Nur wenn das nicht reicht (kein Quelltext, Klasse
+    z. B. re-exportiert), wird wirklich importiert. Fehler → Exception.
+    """
+    spec = importlib.util.find_spec(module_path)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{module_path}'")
+    source = spec.loader.get_source(module_path) if spec.loader is not None else None
+    if source is not None:
+        tree = ast.parse(source)
+        if any(isinstance(n, ast.ClassDef) and n.name == class_name for n in tree.body):
+            return
+    getattr(importlib.import_module(module_path), class_name)
 
 
 class _AddDialog(tk.Toplevel):
@@ -57,6 +95,8 @@ class _AddDialog(tk.Toplevel):
         ttk.Button(btns, text="Add", command=self._add).pack(side="right")
 
         self._desc: ModuleDescriptor | None = None
+        # True, sobald ein Modul tatsächlich registriert wurde
+        self.result = False
 
     def _select(self) -> None:
         path = filedialog.askopenfilename(
@@ -112,8 +152,7 @@ class _AddDialog(tk.Toplevel):
 
     def _validate_classes(self, d: ModuleDescriptor) -> bool:
         try:
-            mod = importlib.import_module(d.module_path)
-            getattr(mod, d.class_name)
+            _check_class(d.module_path, d.class_name)
         except Exception as exc:
             messagebox.showerror("Import error", f"main_class failed:\n{exc}", parent=self)
             logger.log("ModuleMgmt", "ImportError", message=str(exc))
@@ -122,8 +161,7 @@ class _AddDialog(tk.Toplevel):
         if d.settings_class:
             try:
                 pkg, cls_name = d.settings_class.rsplit(".", 1)
-                smod = importlib.import_module(pkg)
-                getattr(smod, cls_name)
+                _check_class(pkg, cls_name)
             except Exception as exc:
                 messagebox.showerror("Import error", f"settings_class failed:\n{exc}", parent=self)
                 logger.log("ModuleMgmt", "ImportError", message=str(exc))
@@ -152,128 +190,260 @@ class _AddDialog(tk.Toplevel):
             return
 
         self.repo.upsert(self._desc)
+        self.result = True
         invalidate_registry_cache()
         logger.log("ModuleMgmt", "AddModule", message=f"{self._desc.id}:{self._desc.version}")
         messagebox.showinfo("Module added", f"{self._desc.label} (v{self._desc.version}) installed.", parent=self)
         self.destroy()
 
 
-class _RowWidgets:
-    def __init__(self, parent: ttk.Frame, row: int, desc: ModuleDescriptor):
-        self.desc = desc
-        self.var_enabled = tk.BooleanVar(value=bool(desc.enabled))
-        ttk.Checkbutton(parent, variable=self.var_enabled).grid(row=row, column=0, padx=4, pady=2)
-
-        ttk.Label(parent, text=f"{desc.label}  (v{desc.version})").grid(row=row, column=1, sticky="w")
-
-        self.var_sort = tk.IntVar(value=desc.sort_order)
-        ttk.Spinbox(parent, from_=1, to=999, textvariable=self.var_sort, width=5).grid(row=row, column=2)
-
-        self.var_vis = {r: tk.BooleanVar(value=r in desc.visible_list) for r in ROLES}
-        self.var_set = {r: tk.BooleanVar(value=r in desc.settings_list) for r in ROLES}
+class _ModuleRow:
+    """
+    Bearbeitungszustand einer Modulzeile (ohne eigene Widgets).
 
-        for col, role in enumerate(ROLES, start=3):
-            ttk.Checkbutton(parent, variable=self.var_vis[role]).grid(row=row, column=col)
-        for col, role in enumerate(ROLES, start=6):
-            ttk.Checkbutton(parent, variable=self.var_set[role]).grid(row=row, column=col)
+    Die Tabelle zeigt nur Werte an; Klicks ändern diesen Zustand und die
+    Zeile wird über :meth:`values` neu gerendert.
+    """
+    def __init__(self, desc: ModuleDescriptor):
+        self.desc = desc
+        self.enabled = bool(desc.enabled) or bool(desc.is_core)
+        self.sort_order = desc.sort_order
+        # visible_list/settings_list parsen bei jedem Zugriff JSON → einmal pro Zeile
+        self.vis = set(desc.visible_list)
+        self.stg = set(desc.settings_list)
+        # Nur geänderte Zeilen werden beim Speichern validiert/geschrieben.
+        # Core-Module sind immer aktiv: steht in der DB enabled=0, gilt die
+        # Zeile von Anfang an als geändert und wird beim Speichern korrigiert.
+        self.dirty = bool(desc.is_core) and not desc.enabled
+
+    def values(self) -> tuple:
+        """Zellwerte in Spaltenreihenfolge (siehe COLUMNS)."""
+        d = self.desc
+        return (
+            _CHECK[self.enabled],
+            f"{d.label}  (v{d.version})",
+            self.sort_order,
+            *(_CHECK[r in self.vis] for r in ROLES),
+            *(_CHECK[r in self.stg] for r in ROLES),
+            "Yes" if d.license_required else "No",
+        )
 
-        # Lizenz-Hinweis (read-only Anzeige)
-        lic = "Yes" if desc.license_required else "No"
-        ttk.Label(parent, text=f"License: {lic}").grid(row=row, column=9, padx=6)
+    def toggle(self, column: str) -> bool:
+        """Checkbox-Spalte umschalten; False, wenn die Zelle nicht editierbar ist."""
+        if column == "enabled":
+            if self.desc.is_core:
+                return False
+            self.enabled = not self.enabled
+            self.dirty = True
+            return True
+        kind, _, role = column.partition("_")
+        roles = {"vis": self.vis, "stg": self.stg}.get(kind)
+        if roles is None or role not in ROLES:
+            return False
+        roles ^= {role}
+        self.dirty = True
+        return True
 
-        if desc.is_core:
-            self.var_enabled.set(True)
-            parent.grid_slaves(row=row, column=0)[0].state(["disabled"])
+    def set_sort_order(self, value: int) -> None:
+        if value != self.sort_order:
+            self.sort_order = value
+            self.dirty = True
 
     def to_descriptor(self) -> ModuleDescriptor:
-        vis = [r for r, v in self.var_vis.items() if v.get()]
-        stg = [r for r, v in self.var_set.items() if v.get()]
-        d = self.desc
-        return ModuleDescriptor(
-            id=d.id,
-            label=d.label,
-            module_path=d.module_path,
-            class_name=d.class_name,
-            version=d.version,
-            enabled=int(self.var_enabled.get()),
-            is_core=d.is_core,
-            sort_order=int(self.var_sort.get()),
-            visible_for=json.dumps(vis or ["Admin"]),
-            settings_for=json.dumps(stg or ["Admin"]),
-            requires_login=d.requires_login,
-            permissions=d.permissions,
-            settings_class=d.settings_class,
-            meta_path=d.meta_path,
-            license_required=d.license_required,
-            license_tag=d.license_tag,
+        # Nur die editierbaren Felder ersetzen, der Rest kommt aus self.desc
+        return replace(
+            self.desc,
+            enabled=int(self.enabled),
+            sort_order=int(self.sort_order),
+            visible_for=_ROLES_JSON[frozenset(self.vis.intersection(ROLES))],
+            settings_for=_ROLES_JSON[frozenset(self.stg.intersection(ROLES))],
         )
 
 
 class ModulesConfigTab(ttk.Frame):
+    """
+    Modultabelle als ein ttk.Treeview (eine Zeile pro Modul).
+
+    Checkbox-Spalten werden per Klick umgeschaltet, die Sortierung per
+    Doppelklick über eine einzelne, bei Bedarf eingeblendete Spinbox editiert.
+    """
     def __init__(self, parent: ttk.Notebook):
         super().__init__(parent)
         self.repo = ModuleRepository()
-        self._rows: List[_RowWidgets] = []
-
-        canvas = tk.Canvas(self, borderwidth=0)
-        inner = ttk.Frame(canvas)
-        vsb = ttk.Scrollbar(self, orient="vertical", command=canvas.yview)
-        canvas.configure(yscrollcommand=vsb.set)
+        self._rows: dict[str, _ModuleRow] = {}
+        self._sort_editor: ttk.Spinbox | None = None
+
+        # Scan läuft auf einem Worker, nicht im Tk-Mainloop
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="modules-scan")
+        self._scan_future: Future | None = None
+
+        table = ttk.Frame(self)
+        table.pack(fill="both", expand=True)
+        tree = ttk.Treeview(table, columns=COLUMNS, show="headings", selectmode="browse")
+        vsb = ttk.Scrollbar(table, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=vsb.set)
         vsb.pack(side="right", fill="y")
-        canvas.pack(side="left", fill="both", expand=True)
-        canvas.create_window((0, 0), window=inner, anchor="nw")
-        inner.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        tree.pack(side="left", fill="both", expand=True)
+        for col, text in zip(COLUMNS, HEADERS):
+            tree.heading(col, text=text)
+            tree.column(col, width=70, anchor="center", stretch=False)
+        tree.column("label", width=240, anchor="w", stretch=True)
+        tree.bind("<Button-1>", self._on_click)
+        tree.bind("<Double-Button-1>", self._on_double_click)
+        self._tree = tree
 
-        # Header
-        headers = ["", "Label", "Sort", "Admin", "QMB", "User", "Admin", "QMB", "User", "License"]
-        for col, text in enumerate(headers):
-            ttk.Label(inner, text=text, style="Heading.TLabel").grid(row=0, column=col, padx=4, pady=4)
-
-        self._inner = inner
         self._reload_rows()
 
         br = ttk.Frame(self)
         br.pack(fill="x", pady=8)
-        ttk.Button(br, text="Add Module…", command=self._open_add).pack(side="left", padx=6)
-        ttk.Button(br, text="Scan for Modules", command=self._scan).pack(side="left")
-        ttk.Button(br, text="Save", command=self._save).pack(side="right", padx=6)
-        ttk.Button(br, text="Cancel", command=self._reload_rows).pack(side="right")
+        self._buttons = [
+            ttk.Button(br, text="Add Module…", command=self._open_add),
+            ttk.Button(br, text="Scan for Modules", command=self._scan),
+            ttk.Button(br, text="Save", command=self._save),
+            ttk.Button(br, text="Cancel", command=self._reload_rows),
+        ]
+        self._buttons[0].pack(side="left", padx=6)
+        self._buttons[1].pack(side="left")
+        self._buttons[2].pack(side="right", padx=6)
+        self._buttons[3].pack(side="right")
+        # Nur während eines Scans sichtbar
+        self._scan_label = ttk.Label(br, text="Scanning…")
 
     def _reload_rows(self) -> None:
-        for w in self._inner.grid_slaves():
-            w.destroy()
-        headers = ["", "Label", "Sort", "Admin", "QMB", "User", "Admin", "QMB", "User", "License"]
-        for col, text in enumerate(headers):
-            ttk.Label(self._inner, text=text, style="Heading.TLabel").grid(row=0, column=col, padx=4, pady=4)
-        self._rows.clear()
-        for idx, desc in enumerate(self.repo.all_modules(), start=1):
-            self._rows.append(_RowWidgets(self._inner, idx, desc))
+        self._close_sort_editor(commit=False)
+        tree = self._tree
+        old = self._rows
+        self._rows = {}
+        for idx, desc in enumerate(self.repo.all_modules()):
+            row = _ModuleRow(desc)
+            self._rows[desc.id] = row
+            # Vorhandene Zeilen nur aktualisieren/verschieben (Auswahl und
+            # Scrollposition bleiben erhalten), neue einfügen
+            if desc.id in old:
+                tree.item(desc.id, values=row.values())
+                tree.move(desc.id, "", idx)
+            else:
+                tree.insert("", idx, iid=desc.id, values=row.values())
+        gone = [iid for iid in old if iid not in self._rows]
+        if gone:
+            tree.delete(*gone)
+
+    # ------------------------------------------------------------------ #
+    # Zellen-Editing                                                     #
+    # ------------------------------------------------------------------ #
+    def _cell_at(self, event) -> tuple[str, str] | None:
+        """(iid, Spaltenname) unter dem Mauszeiger oder None."""
+        tree = self._tree
+        if tree.identify_region(event.x, event.y) != "cell":
+            return None
+        iid = tree.identify_row(event.y)
+        col = tree.identify_column(event.x)  # "#1" …
+        if not iid or not col:
+            return None
+        return iid, COLUMNS[int(col[1:]) - 1]
+
+    def _on_click(self, event) -> None:
+        cell = self._cell_at(event)
+        if cell is None:
+            return
+        iid, column = cell
+        row = self._rows[iid]
+        if row.toggle(column):
+            self._tree.item(iid, values=row.values())
+
+    def _on_double_click(self, event) -> None:
+        cell = self._cell_at(event)
+        if cell is None or cell[1] != "sort":
+            return
+        iid = cell[0]
+        self._close_sort_editor(commit=True)
+        x, y, w, h = self._tree.bbox(iid, "sort")
+        editor = ttk.Spinbox(self._tree, from_=1, to=999, width=5)
+        editor.set(self._rows[iid].sort_order)
+        editor.place(x=x, y=y, width=w, height=h)
+        editor.focus_set()
+        editor.bind("<Return>", lambda e: self._close_sort_editor(commit=True))
+        editor.bind("<Escape>", lambda e: self._close_sort_editor(commit=False))
+        editor.bind("<FocusOut>", lambda e: self._close_sort_editor(commit=True))
+        editor.iid = iid  # type: ignore[attr-defined]
+        self._sort_editor = editor
+
+    def _close_sort_editor(self, *, commit: bool) -> None:
+        editor, self._sort_editor = self._sort_editor, None
+        if editor is None:
+            return
+        iid = editor.iid  # type: ignore[attr-defined]
+        if commit and iid in self._rows:
+            try:
+                value = int(editor.get())
+            except ValueError:
+                value = None
+            if value is not None and 1 <= value <= 999:
+                row = self._rows[iid]
+                row.set_sort_order(value)
+                self._tree.item(iid, values=row.values())
+        editor.destroy()
 
     def _open_add(self) -> None:
-        _AddDialog(self, self.repo)
-        self._reload_rows()
-        invalidate_registry_cache()
+        dlg = _AddDialog(self, self.repo)
+        self.wait_window(dlg)
+        # Abbrechen ändert nichts → kein Neuaufbau; den Registry-Cache hat
+        # _AddDialog._add nach dem upsert bereits invalidiert
+        if dlg.result:
+            self._reload_rows()
 
     def _scan(self) -> None:
-        count = self.repo.discover_and_register(default_roots())
+        if self._scan_future is not None:
+            return
+        # Während des Scans keine weiteren Aktionen (kein Reentry)
+        for b in self._buttons:
+            b.state(["disabled"])
+        self._scan_label.pack(side="left", padx=6)
+        self._scan_future = self._executor.submit(self.repo.discover_and_register, default_roots())
+        self.after(_POLL_MS, self._poll_scan)
+
+    def _poll_scan(self) -> None:
+        future = self._scan_future
+        if future is None:
+            return
+        if not future.done():
+            self.after(_POLL_MS, self._poll_scan)
+            return
+        self._scan_future = None
+        self._scan_label.pack_forget()
+        for b in self._buttons:
+            b.state(["!disabled"])
+        try:
+            count = future.result()
+        except Exception as exc:  # noqa: BLE001
+            messagebox.showerror("Scan", f"Scan failed:\n{exc}", parent=self)
+            logger.log("ModuleMgmt", "ScanFailed", message=str(exc))
+            return
         invalidate_registry_cache()
         self._reload_rows()
         messagebox.showinfo("Scan", f"{count} module(s) discovered/updated.", parent=self)
 
+    def destroy(self):
+        self._scan_future = None
+        self._executor.shutdown(wait=False)
+        super().destroy()
+
     def _save(self) -> None:
-        # Validierung: Klassen importierbar?
-        invalid = []
-        for r in self._rows:
-            d = r.to_descriptor()
-            if d.safe_load_class() is None:
-                invalid.append(d.label)
+        self._close_sort_editor(commit=True)
+        changed = [r for r in self._rows.values() if r.dirty]
+        # Ein Descriptor pro geänderter Zeile – für Validierung und Speichern
+        descs = [r.to_descriptor() for r in changed]
+        # Validierung: Klassen importierbar? (nur geänderte Module laden)
+        invalid = [d.label for d in descs if d.safe_load_class() is None]
         if invalid:
             messagebox.showerror("Validation", "Import failed:\n" + "\n".join(invalid), parent=self)
             logger.log("ModuleMgmt", "ValidateFailed", message=str(invalid))
             return
 
-        for r in self._rows:
-            self.repo.upsert(r.to_descriptor())
+        self.repo.upsert_many(descs)  # eine Transaktion für alle Zeilen
+        for r, d in zip(changed, descs):
+            r.desc = d
+            r.dirty = False
 
         invalidate_registry_cache()
         logger.log("ModuleMgmt", "SavedByAdmin")
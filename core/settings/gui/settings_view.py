@@ -6,17 +6,25 @@ Notebook for all settings tabs.
 
 Design:
 - Only settings tabs provided by each module's `settings_class`.
+- Tabs are built lazily: the notebook holds a placeholder frame per tab;
+  settings classes are imported on a worker thread as soon as the view
+  opens, construction happens (on the Tk thread) when the tab is first
+  selected.
 - Each specialized settings tab is self-contained (own Save/Validate).
 - Admin tabs: Config + Module Mgmt.
 """
 
 from __future__ import annotations
 
+import functools
 import importlib
 import tkinter as tk
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import ttk
 
 from core.common.app_context import AppContext, T
+from core.common.module_descriptor import ModuleDescriptor
 from core.common.module_registry import load_registry
 from core.config.gui.config_settings_view import ConfigSettingsTab
 from core.settings.gui.modules_config_tab import ModulesConfigTab
@@ -24,6 +32,20 @@ from core.settings.logic.settings_manager import SettingsManager
 from core.models.user import UserRole
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_class(dotted: str) -> type:
+    """'pkg.mod.Class' → class; cached across SettingsView instances.
+
+    Errors propagate and are not cached, so a failing import is retried.
+    """
+    pkg, cls_name = dotted.rsplit(".", 1)
+    return getattr(importlib.import_module(pkg), cls_name)
+
+
+# Abstand, in dem after() fertige Imports abholt
+_POLL_MS = 50
+
+
 class SettingsView(ttk.Frame):
     """Root view hosting all settings tabs."""
 
@@ -39,24 +61,79 @@ class SettingsView(ttk.Frame):
         nb.pack(fill="both", expand=True, padx=6, pady=6)
         self._nb = nb
 
+        # Noch nicht aufgebaute Tabs: Platzhalter-Widgetname → Builder
+        self._pending: dict[str, Callable[[ttk.Frame], None]] = {}
+        nb.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+
+        # Imports laufen hier, nie im Tk-Thread; Ergebnisse holt after() ab.
+        # Pro View, damit destroy() offene Imports abbrechen kann.
+        self._import_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="settings-import")
+
         # Module settings tabs (settings_class only)
         role = AppContext.current_user.role if AppContext.current_user else None
-        for desc in load_registry(role=role).values():
-            if not desc.settings_class:
-                continue
-            if not desc.allowed_in_settings(role):
-                continue
-            try:
-                pkg, cls_name = desc.settings_class.rsplit(".", 1)
-                smod = importlib.import_module(pkg)
-                cls = getattr(smod, cls_name)
-                # Pass shared SettingsManager to each tab
-                tab = cls(self._nb, sm=self.sm)
-                self._nb.add(tab, text=f"{desc.label} ⚙")
-            except Exception as exc:
-                print(f"[WARN] Failed to load settings_class for {desc.id}: {exc}")
+        module_tabs = [
+            d for d in load_registry(role=role).values()
+            if d.settings_class and d.allowed_in_settings(role)
+        ]
+        for desc in module_tabs:
+            # Import sofort anstoßen, Tab erst bei Auswahl bauen
+            future = self._import_pool.submit(_resolve_class, desc.settings_class)
+            self._add_lazy_tab(
+                f"{desc.label} ⚙", functools.partial(self._build_module_tab, desc=desc, future=future)
+            )
 
         # Admin tabs
         if self._is_admin:
-            self._nb.add(ConfigSettingsTab(self._nb), text=T("core.config"))
-            self._nb.add(ModulesConfigTab(self._nb), text="Module Mgmt")
+            self._add_lazy_tab(T("core.config"), self._fill_with(ConfigSettingsTab))
+            self._add_lazy_tab("Module Mgmt", self._fill_with(ModulesConfigTab))
+
+    def destroy(self):
+        pool = getattr(self, "_import_pool", None)
+        if pool is not None:
+            # Laufende Imports enden von selbst; noch nicht gestartete entfallen
+            pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
+    # ------------------------------------------------------------------ #
+    # Lazy tabs                                                          #
+    # ------------------------------------------------------------------ #
+    def _add_lazy_tab(self, text: str, build: Callable[[ttk.Frame], None]) -> None:
+        placeholder = ttk.Frame(self._nb)
+        self._nb.add(placeholder, text=text)
+        self._pending[str(placeholder)] = build
+
+    def _on_tab_changed(self, _event=None) -> None:
+        selected = self._nb.select()
+        build = self._pending.pop(selected, None)
+        if build is not None:
+            build(self._nb.nametowidget(selected))
+
+    @staticmethod
+    def _fill_with(tab_cls: type) -> Callable[[ttk.Frame], None]:
+        def build(placeholder: ttk.Frame) -> None:
+            tab_cls(placeholder).pack(fill="both", expand=True)
+        return build
+
+    def _build_module_tab(
+        self, placeholder: ttk.Frame, *, desc: ModuleDescriptor, future: Future
+    ) -> None:
+        """Build the module's settings_class into *placeholder* once imported."""
+        if not placeholder.winfo_exists():
+            return
+        if not future.done():
+            if not placeholder.winfo_children():
+                ttk.Label(placeholder, text="Loading…").pack(padx=20, pady=20)
+            placeholder.after(
+                _POLL_MS, functools.partial(self._build_module_tab, placeholder, desc=desc, future=future)
+            )
+            return
+        for child in placeholder.winfo_children():
+            child.destroy()
+        try:
+            cls = future.result()
+            # Pass shared SettingsManager to each tab
+            tab = cls(placeholder, sm=self.sm)
+            tab.pack(fill="both", expand=True)
+        except Exception as exc:
+            print(f"[WARN] Failed to load settings_class for {desc.id}: {exc}")
+            ttk.Label(placeholder, text=f"{desc.label}: {exc}", foreground="red").pack(padx=20, pady=20)
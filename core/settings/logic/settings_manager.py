@@ -6,23 +6,20 @@ High-Level-API für Settings.
 """
 
 from __future__ import annotations
-from threading import RLock
-from typing import Any, Final
+from typing import Any, Mapping
 
 from core.qm_logging.logic.logger import logger
 from core.settings.logic.settings_repository import SettingsRepository
 
 
 class SettingsManager:
-    _instance: "SettingsManager | None" = None
-    _lock: Final[RLock] = RLock()
+    """Dünne Fassade; gemeinsamer Zustand liegt im Singleton SettingsRepository.
 
-    def __new__(cls) -> "SettingsManager":  # noqa: D401
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._repo = SettingsRepository()
-            return cls._instance
+    Normalerweise die globale Instanz ``settings_manager`` verwenden.
+    """
+
+    def __init__(self, repo: SettingsRepository | None = None) -> None:
+        self._repo = repo if repo is not None else SettingsRepository()
 
     # ------------------------------------------------------------------ #
     #  API                                                               #
@@ -55,6 +52,22 @@ class SettingsManager:
         self._repo.set(namespace, key, value, user_id if user_specific else None)
         logger.log("SettingsManager", "Set", message=f"{namespace}.{key}")
 
+    def set_many(
+        self,
+        namespace: str,
+        values: Mapping[str, Any],
+        *,
+        user_specific: bool = False,
+        user_id: str | None = None,
+    ) -> None:
+        """Wie :meth:`set` für mehrere Keys – ein Commit statt einem pro Key."""
+        if user_specific and not user_id:
+            raise ValueError("user_id muss gesetzt sein, wenn user_specific=True")
+        if not values:
+            return
+        self._repo.set_many(namespace, values, user_id if user_specific else None)
+        logger.log("SettingsManager", "SetMany", message=f"{namespace}: {', '.join(values)}")
+
     def delete(
         self,
         namespace: str,
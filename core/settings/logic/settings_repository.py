@@ -1,129 +1,191 @@
 from __future__ import annotations
-import json, sqlite3
+import json
+import re
+from collections import OrderedDict
+from pathlib import Path
 from threading import RLock
-from typing import Any, Final
+from typing import Any, Final, Mapping
 from core.config.config_loader import QM_DB_PATH
 from core.qm_logging.logic.logger import logger
 from core.common.db_interface import SQLiteRepository
+from core.helpers.json_helper import loads as _fast_loads
 
+# Schreiben immer per stdlib: exakt für NaN/Infinity und Ints > 64 Bit
+# (orjson schreibt NaN als null und lehnt große Ints ab); Settings werden selten geschrieben
 def _to_json(v: Any) -> str:            # serialisieren
     try: return json.dumps(v)
     except TypeError: return json.dumps(str(v))
 
+# orjson liest Ganzzahlen ab 19 Stellen ggf. als float (2**70 → 1.18e21)
+# → solche Texte liest die stdlib, der Rest läuft über den schnellen Parser
+_LONG_INT: Final = re.compile(r"\d{19}")
+
 def _from_json(txt: str) -> Any:        # deserialisieren
+    if _LONG_INT.search(txt) is None:
+        try: return _fast_loads(txt)
+        except ValueError: pass         # NaN/Infinity o. ä. (nur stdlib)
     try: return json.loads(txt)
     except Exception: return txt        # noqa: BLE001
 
+# Eine langlebige Verbindung (self.conn); WAL + NORMAL spart fsyncs pro Commit
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+)
+_CACHED_STATEMENTS = 256
+
+# SQL einmal als Konstante – gleicher Text trifft den Statement-Cache
+_SELECT_SQL: Final = "SELECT value FROM settings WHERE namespace=? AND key=? AND user_id=?"
+_UPSERT_SQL: Final = (
+    "INSERT INTO settings (namespace,key,value,user_id) VALUES (?,?,?,?) "
+    "ON CONFLICT(namespace,key,user_id) DO UPDATE SET value=excluded.value"
+)
+_DELETE_SQL: Final = "DELETE FROM settings WHERE namespace=? AND key=? AND user_id=?"
+
+# WITHOUT ROWID: der PK ist der Clustering-Key, ein B-Tree-Lookup liefert value.
+# PK-Spalten sind dort NOT NULL → globale Werte haben user_id '' statt NULL
+# (NULL war im PK außerdem nicht eindeutig: Upserts legten Duplikate an).
+_GLOBAL: Final = ""
+_CREATE_SQL: Final = """
+    CREATE TABLE IF NOT EXISTS {table}(
+        namespace TEXT NOT NULL,
+        key       TEXT NOT NULL,
+        value     TEXT NOT NULL,
+        user_id   TEXT NOT NULL DEFAULT '',
+        PRIMARY KEY(namespace,key,user_id)
+    ) WITHOUT ROWID
+"""
+
+# Lese-Cache (LRU): unveränderliche Werte direkt, alles andere als JSON-Text
+# (jeder get() liefert dann eine frische Liste/Dict – Aufrufer dürfen mutieren).
+# Begrenzt, da auch Fehltreffer (_ABSENT) für jeden je gefragten Key landen.
+_CACHE_MAX: Final = 1024
+_MISS: Final = object()                 # nicht im Cache
+_ABSENT: Final = object()               # Key existiert nicht in der DB
+_IMMUTABLE = (str, int, float, bool, type(None))
+
+class _Raw(str):                        # markiert gecachten JSON-Text
+    __slots__ = ()
+
 # ------------------------------------------------------------------ #
 class SettingsRepository(SQLiteRepository):
     _inst: "SettingsRepository|None" = None
     _lock: Final[RLock] = RLock()
 
-    def __new__(cls):                   # Singleton
+    def __new__(cls, db_path: Path | None = None):  # Singleton
+        if db_path is not None:         # eigener Pfad → eigene Instanz (Tests)
+            return super().__new__(cls)
         with cls._lock:
             if cls._inst is None:
                 cls._inst = super().__new__(cls)
         return cls._inst
 
-    def __init__(self) -> None:
+    def __init__(self, db_path: Path | None = None) -> None:
         if getattr(self, "_ready", False): return
         self._ready = True
-        super().__init__(QM_DB_PATH, check_same_thread=False)
+        super().__init__(db_path if db_path is not None else QM_DB_PATH,
+                         check_same_thread=False, cached_statements=_CACHED_STATEMENTS)
+        self._cache: OrderedDict[tuple[str, str, str], Any] = OrderedDict()
+        for pragma in _PRAGMAS: self.conn.execute(pragma)
         self._ensure_schema()
 
     # ------------------------- öffentliche API ----------------------- #
     def get(self, ns: str, key: str, uid: str | None, fb: Any = None) -> Any | None:
-        try:
-            row = self.conn.execute(
-                "SELECT value FROM settings WHERE namespace=? AND key=? AND user_id IS ?",
-                (ns, key, uid),
-            ).fetchone()
-            return _from_json(row["value"]) if row else fb
-        except sqlite3.OperationalError as exc:
-            if "namespace" in str(exc): self._hard_rebuild(); return self.get(ns, key, uid, fb)
-            raise
+        uid = uid or _GLOBAL
+        ck = (ns, key, uid)
+        hit = self._cache.get(ck, _MISS)
+        if hit is not _MISS:
+            try: self._cache.move_to_end(ck)
+            except KeyError: pass       # parallel per set()/delete() entfernt
+            if hit is _ABSENT: return fb
+            return _from_json(hit) if type(hit) is _Raw else hit
+        row = self.conn.execute(_SELECT_SQL, (ns, key, uid)).fetchone()
+        if row is None:
+            self._remember(ck, _ABSENT)
+            return fb
+        val = _from_json(row["value"])
+        self._remember(ck, val if isinstance(val, _IMMUTABLE) else _Raw(row["value"]))
+        return val
 
     def set(self, ns: str, key: str, val: Any, uid: str | None) -> None:
-        try:
-            with self.conn:
-                self.conn.execute(
-                    """
-                    INSERT INTO settings (namespace,key,value,user_id)
-                    VALUES (?,?,?,?)
-                    ON CONFLICT(namespace,key,user_id) DO
-                    UPDATE SET value=excluded.value
-                    """,
-                    (ns, key, _to_json(val), uid),
-                )
-        except sqlite3.OperationalError as exc:
-            if "namespace" in str(exc): self._hard_rebuild(); self.set(ns, key, val, uid)
-            else: raise
+        uid = uid or _GLOBAL
+        self._cache.pop((ns, key, uid), None)
+        with self.conn:
+            self.conn.execute(_UPSERT_SQL, (ns, key, _to_json(val), uid))
+
+    def set_many(self, ns: str, items: Mapping[str, Any], uid: str | None) -> None:
+        """Mehrere Keys eines Namespace in einer Transaktion schreiben."""
+        uid = uid or _GLOBAL
+        rows = [(ns, k, _to_json(v), uid) for k, v in items.items()]
+        if not rows: return
+        for k in items: self._cache.pop((ns, k, uid), None)
+        with self.conn:
+            self.conn.executemany(_UPSERT_SQL, rows)
 
     def delete(self, ns: str, key: str, uid: str | None) -> None:
+        uid = uid or _GLOBAL
+        self._cache.pop((ns, key, uid), None)
         with self.conn:
-            self.conn.execute(
-                "DELETE FROM settings WHERE namespace=? AND key=? AND user_id IS ?",
-                (ns, key, uid),
-            )
+            self.conn.execute(_DELETE_SQL, (ns, key, uid))
+
+    def _remember(self, ck: tuple[str, str, str], val: Any) -> None:
+        cache = self._cache
+        cache[ck] = val
+        while len(cache) > _CACHE_MAX:  # ältesten Eintrag verdrängen
+            try: cache.popitem(last=False)
+            except KeyError: break
 
     # ------------------------- Schema / Migration -------------------- #
     def _ensure_schema(self) -> None:
+        # Schema wird genau hier (einmal pro Prozess) geprüft und ggf. migriert;
+        # get/set laufen danach ohne OperationalError-Retry.
         # Normales Ziel-Schema
-        self.conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS settings(
-                namespace TEXT NOT NULL,
-                key       TEXT NOT NULL,
-                value     TEXT NOT NULL,
-                user_id   TEXT,
-                PRIMARY KEY(namespace,key,user_id)
-            )
-            """
-        )
+        self.conn.execute(_CREATE_SQL.format(table="settings"))
         self.conn.commit()
 
         cols = {c["name"] for c in self.conn.execute("PRAGMA table_info(settings)")}
-        if "namespace" not in cols or "user_id" not in cols:
+        ddl = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='settings'"
+        ).fetchone()["sql"]
+        # Alt-Schema oder noch Rowid-Tabelle (user_id NULL) → migrieren
+        if "namespace" not in cols or "user_id" not in cols or "WITHOUT ROWID" not in ddl.upper():
             self._hard_rebuild()
 
     # ------------------------- HARDR E B U I L D --------------------- #
     def _hard_rebuild(self) -> None:
-        """Rebuild für alle denkbaren Alt-Schemata: section, namespace oder gar nichts."""
-        logger.log("SettingsRepo", "HardRebuild", message="start")
+        """Rebuild für alle denkbaren Alt-Schemata: section, namespace oder gar nichts.
 
-        self.conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS settings_new(
-                namespace TEXT NOT NULL,
-                key       TEXT NOT NULL,
-                value     TEXT NOT NULL,
-                user_id   TEXT,
-                PRIMARY KEY(namespace,key,user_id)
-            )
-            """
-        )
+        Alt-Tabellen sind Rowid-Tabellen; bei Duplikaten gewinnt per
+        INSERT OR REPLACE … ORDER BY rowid jeweils der zuletzt geschriebene Wert.
+        """
+        logger.log("SettingsRepo", "HardRebuild", message="start")
+        self._cache.clear()
 
         cur = self.conn.execute("PRAGMA table_info(settings)")
         legacy_cols = {r["name"] for r in cur.fetchall()}
+        uid = "COALESCE(user_id,'')" if "user_id" in legacy_cols else "''"
 
         if "section" in legacy_cols:
             # GANZ alt
-            select = "SELECT section AS namespace, key, value, NULL AS user_id FROM settings GROUP BY section, key"
+            select = "SELECT section AS namespace, key, value, '' AS user_id FROM settings ORDER BY rowid"
         elif "namespace" in legacy_cols:
-            select = "SELECT namespace, key, value, COALESCE(user_id,NULL) AS user_id FROM settings GROUP BY namespace, key, user_id"
+            select = f"SELECT namespace, key, value, {uid} AS user_id FROM settings ORDER BY rowid"
         elif "key" in legacy_cols and "value" in legacy_cols:
             # Nur key, value – wir nehmen "app" als Standard-Namespace
-            select = "SELECT 'app' AS namespace, key, value, NULL AS user_id FROM settings GROUP BY key"
+            select = "SELECT 'app' AS namespace, key, value, '' AS user_id FROM settings ORDER BY rowid"
         else:
             # Nichts passt, Tabelle einfach löschen
+            select = None
+
+        # Alles in EINER Transaktion: ein Commit statt einem pro DDL-Statement,
+        # und bei einem Fehler bleibt die alte Tabelle unverändert stehen
+        with self.conn:
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.execute("DROP TABLE IF EXISTS settings_new")   # Rest eines Abbruchs
+            self.conn.execute(_CREATE_SQL.format(table="settings_new"))
+            if select:
+                self.conn.execute(f"INSERT OR REPLACE INTO settings_new(namespace,key,value,user_id) {select}")
             self.conn.execute("DROP TABLE settings")
             self.conn.execute("ALTER TABLE settings_new RENAME TO settings")
-            self.conn.commit()
-            logger.log("SettingsRepo", "HardRebuild", message="reset blank")
-            return
-
-        self.conn.execute(f"INSERT OR REPLACE INTO settings_new(namespace,key,value,user_id) {select}")
-        self.conn.execute("DROP TABLE settings")
-        self.conn.execute("ALTER TABLE settings_new RENAME TO settings")
-        self.conn.commit()
-        logger.log("SettingsRepo", "HardRebuild", message="done")
+        logger.log("SettingsRepo", "HardRebuild", message="done" if select else "reset blank")
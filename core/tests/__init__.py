@@ -1 +1,23 @@
-"""Test package for core."""
+"""Test package for core.
+
+Tests must never touch the committed databases (databases/*.db): importing
+the logger or the settings layer opens, migrates and writes them. The DB
+paths are therefore redirected to a temp directory here, before any test
+module imports those packages.
+"""
+
+from __future__ import annotations
+
+import tempfile
+from pathlib import Path
+
+from core.config import config_loader as _config_loader
+
+TEST_DB_DIR = Path(tempfile.mkdtemp(prefix="qmtool-tests-"))
+
+_config_loader.config_service.database.qm_tool = TEST_DB_DIR / "qm-tool.db"
+_config_loader.config_service.database.logging = TEST_DB_DIR / "logs.db"
+_config_loader.QM_DB_PATH = _config_loader.config_service.database.qm_tool
+_config_loader.LOG_DB_PATH = _config_loader.config_service.database.logging
+_config_loader.QM_DB_PATH_STR = str(_config_loader.QM_DB_PATH)
+_config_loader.LOG_DB_PATH_STR = str(_config_loader.LOG_DB_PATH)
@@ -0,0 +1,60 @@
+"""
+core/tests/test_log_export_utils.py
+
+Unit tests for the JSON log export format.
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from core.helpers import json_helper
+from core.qm_logging.logic import log_export_utils
+
+_LOGS = [{"id": 1, "feature": "Prüfung", "message": None}, {"id": 2, "feature": "F"}]
+
+
+class TestLogExport(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "logs.json"
+
+    def test_export_is_indented_with_four_spaces(self) -> None:
+        log_export_utils.export_logs_to_json(_LOGS, self.path)
+        text = self.path.read_text(encoding="utf-8")
+        self.assertEqual(text, json.dumps(_LOGS, indent=4, ensure_ascii=False))
+
+    def test_export_does_not_depend_on_orjson(self) -> None:
+        log_export_utils.export_logs_to_json(_LOGS, self.path)
+        with_orjson = self.path.read_bytes()
+        with mock.patch.object(json_helper, "orjson", None):
+            log_export_utils.export_logs_to_json(_LOGS, self.path)
+        self.assertEqual(self.path.read_bytes(), with_orjson)
+
+    def test_stream_without_orjson(self) -> None:
+        with mock.patch.object(json_helper, "orjson", None):
+            log_export_utils.stream_logs_to_json(iter(_LOGS), self.path, pretty=False)
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8")), _LOGS)
+
+    def test_stream_matches_export(self) -> None:
+        other = self.path.with_name("export.json")
+        for logs in ([], _LOGS, [{"message": "a\nb", "nested": {"x": [1, {}]}}]):
+            with self.subTest(logs=logs):
+                n = log_export_utils.stream_logs_to_json(iter(logs), self.path)
+                log_export_utils.export_logs_to_json(logs, other)
+                self.assertEqual(n, len(logs))
+                self.assertEqual(self.path.read_bytes(), other.read_bytes())
+
+    def test_compact_stream_round_trips(self) -> None:
+        n = log_export_utils.stream_logs_to_json(iter(_LOGS), self.path, pretty=False)
+        self.assertEqual(n, 2)
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8")), _LOGS)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
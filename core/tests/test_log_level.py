@@ -0,0 +1,57 @@
+"""
+core/tests/test_log_level.py
+
+Unit tests for the numeric LogLevel mapping used by the logging DB.
+"""
+
+from __future__ import annotations
+
+import unittest
+
+from core.qm_logging.models.log_entry import ROW_COLUMNS, LogEntry
+from core.qm_logging.models.log_level import LogLevel, level_name
+
+
+class TestLogLevel(unittest.TestCase):
+    def test_coerce_accepts_names_codes_and_aliases(self) -> None:
+        self.assertIs(LogLevel.coerce("error"), LogLevel.ERROR)
+        self.assertIs(LogLevel.coerce(" Warn "), LogLevel.WARNING)
+        self.assertIs(LogLevel.coerce(7), LogLevel.DEBUG)
+        self.assertIs(LogLevel.coerce("6"), LogLevel.INFO)
+        self.assertIs(LogLevel.coerce(LogLevel.ALERT), LogLevel.ALERT)
+
+    def test_coerce_unknown(self) -> None:
+        with self.assertRaises(ValueError):
+            LogLevel.coerce("LOUD")
+        with self.assertRaises(ValueError):
+            LogLevel.coerce(42)
+        self.assertIs(LogLevel.coerce("LOUD", LogLevel.INFO), LogLevel.INFO)
+
+    def test_level_name_roundtrip(self) -> None:
+        for lvl in LogLevel:
+            self.assertEqual(level_name(int(lvl)), lvl.name)
+        # legacy text rows are passed through unchanged
+        self.assertEqual(level_name("ERROR"), "ERROR")
+        self.assertEqual(level_name(None), "INFO")
+
+    def test_from_dict_maps_code_to_name(self) -> None:
+        entry = LogEntry.from_dict({
+            "id": 1,
+            "timestamp": "2025-07-09T15:21:03+00:00",
+            "log_level": 3,
+            "feature": "f",
+            "event": "e",
+        })
+        self.assertEqual(entry.log_level, "ERROR")
+
+    def test_from_row_matches_from_dict(self) -> None:
+        row = (7, "2025-07-09T15:21:03+00:00", 3, "alice", "f", "e", "R-1", "msg", 4)
+        self.assertEqual(
+            LogEntry.from_row(row),
+            LogEntry.from_dict(dict(zip(ROW_COLUMNS, row))),
+        )
+        self.assertEqual(LogEntry.from_row(row).log_level, "WARNING")
+
+
+if __name__ == "__main__":
+    unittest.main()
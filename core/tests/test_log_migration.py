@@ -0,0 +1,94 @@
+"""
+core/tests/test_log_migration.py
+
+Unit tests for the log_level TEXT -> INTEGER migration of the logging DB.
+Runs on a temp DB with the original (pre-migration) schema.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.common.db_interface import create_sqlite_connection
+from core.qm_logging.logic.logger import Logger
+from core.qm_logging.models.log_level import LogLevel
+
+# Schema as shipped before log levels were stored as integers
+_LEGACY_SCHEMA = """
+    CREATE TABLE logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        user_id INTEGER,
+        username TEXT,
+        feature TEXT NOT NULL,
+        event TEXT NOT NULL,
+        reference_id TEXT,
+        message TEXT,
+        log_level TEXT NOT NULL DEFAULT 'INFO'
+    )
+"""
+
+_ROWS = [
+    # (id, level text, expected code)
+    (1, "INFO", LogLevel.INFO),
+    (2, "ERROR", LogLevel.ERROR),
+    (3, "warn", LogLevel.WARNING),
+    (4, " Debug ", LogLevel.DEBUG),
+    (5, "CRIT", LogLevel.CRITICAL),
+    (6, "3", LogLevel.ERROR),
+    (9, "LOUD", LogLevel.INFO),  # unknown -> INFO; gap in ids on purpose
+]
+
+
+class TestTextLevelMigration(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.conn = create_sqlite_connection(Path(self._tmp.name) / "logs.db", isolation_level=None)
+        self.conn.execute(_LEGACY_SCHEMA)
+        self.conn.executemany(
+            "INSERT INTO logs (id, timestamp, user_id, username, feature, event,"
+            " reference_id, message, log_level) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (i, f"2025-01-01T00:00:0{n}+00:00", 7, "alice", "Feat", f"E{i}", f"R{i}", f"m{i}", lvl)
+                for n, (i, lvl, _) in enumerate(_ROWS)
+            ],
+        )
+
+    def tearDown(self) -> None:
+        self.conn.close()
+        self._tmp.cleanup()
+
+    def test_levels_are_mapped_to_codes(self) -> None:
+        Logger._migrate_text_levels(self.conn)
+        cols = {r["name"]: r["type"] for r in self.conn.execute("PRAGMA table_info(logs)")}
+        self.assertEqual(cols["log_level"], "INTEGER")
+        got = dict(self.conn.execute("SELECT id, log_level FROM logs"))
+        self.assertEqual(got, {i: int(code) for i, _, code in _ROWS})
+
+    def test_rows_are_preserved(self) -> None:
+        before = self.conn.execute(
+            "SELECT id, timestamp, user_id, username, feature, event, reference_id, message"
+            " FROM logs ORDER BY id"
+        ).fetchall()
+        Logger._migrate_text_levels(self.conn)
+        after = self.conn.execute(
+            "SELECT id, timestamp, user_id, username, feature, event, reference_id, message"
+            " FROM logs ORDER BY id"
+        ).fetchall()
+        self.assertEqual([tuple(r) for r in after], [tuple(r) for r in before])
+        # AUTOINCREMENT continues after the highest migrated id
+        cur = self.conn.execute(
+            "INSERT INTO logs (timestamp, feature, event) VALUES ('t', 'f', 'e')"
+        )
+        self.assertGreater(cur.lastrowid, max(i for i, _, _ in _ROWS))
+
+    def test_migration_is_idempotent(self) -> None:
+        Logger._migrate_text_levels(self.conn)
+        Logger._migrate_text_levels(self.conn)  # already INTEGER -> no-op
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0], len(_ROWS))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,29 @@
+"""
+core/tests/test_log_view_dates.py
+
+The DD.MM.YYYY filter parser accepts exactly what strptime("%d.%m.%Y") did.
+"""
+
+from __future__ import annotations
+
+import unittest
+from datetime import date
+
+from core.qm_logging.gui.log_view import _parse_ddmmyyyy
+
+
+class TestParseDdMmYyyy(unittest.TestCase):
+    def test_valid(self) -> None:
+        self.assertEqual(_parse_ddmmyyyy("01.02.2025"), date(2025, 2, 1))
+        self.assertEqual(_parse_ddmmyyyy("1.2.2025"), date(2025, 2, 1))
+
+    def test_rejected(self) -> None:
+        for text in ("01.02.25", "01.02.02025", "01. 02.2025", " 1.02.2025", "01.02.2025 ",
+                     "+1.02.2025", "01.02.-025", "001.02.2025", "01.02.２０２５", "31.02.2025",
+                     "01.02", "01.02.2025.1", ""):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                _parse_ddmmyyyy(text)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+core/tests/test_log_view_window.py
+
+Unit tests for the virtualised tree window of LogView and for deferring
+refreshes while a background action runs (no Tk needed: the tree,
+scrollbar and controller are replaced by small fakes).
+"""
+
+from __future__ import annotations
+
+import unittest
+from concurrent.futures import Future
+from unittest import mock
+
+from core.qm_logging.gui.log_view import LogView
+
+
+class _FakeController:
+    def __init__(self, n: int) -> None:
+        self.n = n
+
+        self.calls = 0
+
+    def count_logs(self, **_filters) -> int:
+        self.calls += 1
+        return self.n
+
+    def get_logs(self, *, offset: int = 0, limit: int | None = None, **_filters) -> list[dict]:
+        self.calls += 1
+        hi = self.n if limit is None else min(self.n, offset + limit)
+        return [{"timestamp": f"t{i}", "feature": "F", "event": f"E{i}"} for i in range(offset, hi)]
+
+
+class _FakeTree:
+    def __init__(self) -> None:
+        self.iids: list[str] = []
+
+    def insert(self, _parent, index, *, iid, values) -> None:
+        self.iids.insert(0 if index == 0 else len(self.iids), iid)
+
+    def delete(self, *iids) -> None:
+        for iid in iids:
+            self.iids.remove(iid)  # ValueError wie Tk bei unbekannter iid
+
+
+class _FakeScrollbar:
+    def set(self, *_args) -> None:
+        pass
+
+
+class _FakeProgress:
+    def stop(self) -> None:
+        pass
+
+    def pack_forget(self) -> None:
+        pass
+
+
+def _view(rows: int, size: int) -> LogView:
+    view = LogView.__new__(LogView)
+    view.controller = _FakeController(rows)
+    view.tree = _FakeTree()
+    view._vsb = _FakeScrollbar()
+    view._filters = {}
+    view._total = rows
+    view._log_cache = {}
+    view._window = (0, 0)
+    view._window_size = size
+    view._pending = None
+    view._refresh_deferred = False
+    view._refresh_after_id = None
+    view._progress = _FakeProgress()
+    for name in ("start_date_var", "end_date_var", "feature_var", "event_var",
+                 "log_level_var", "reference_id_var"):
+        setattr(view, name, mock.Mock(get=mock.Mock(return_value="")))
+    return view
+
+
+class TestRenderWindow(unittest.TestCase):
+    def test_scroll_shows_contiguous_window(self) -> None:
+        view = _view(100, 10)
+        view._render_window(0)
+        view._render_window(45)
+        self.assertEqual(view._window, (45, 55))
+        self.assertEqual(view.tree.iids, [str(i) for i in range(45, 55)])
+
+    def test_rows_deleted_meanwhile(self) -> None:
+        view = _view(100, 10)
+        view._render_window(40)
+        view.controller.n = 85  # Zeilen wurden inzwischen gelöscht
+        view._render_window(90)  # Sprung ans Ende (Scrollbar "moveto")
+        self.assertEqual(view._total, 85)
+        self.assertEqual(view._window, (75, 85))
+        self.assertEqual(view.tree.iids, [str(i) for i in range(75, 85)])
+
+
+
+class TestDeferWhilePending(unittest.TestCase):
+    def test_no_queries_while_action_runs_then_one_refresh(self) -> None:
+        view = _view(100, 10)
+        view._render_window(0)
+        view._pending = Future()  # z. B. Archiv hält die Schreibsperre
+        calls = view.controller.calls
+
+        view._populate_logs()       # Refresh-Button / Filteränderung
+        view._render_window(50)     # Scrollen
+        self.assertEqual(view.controller.calls, calls)
+        self.assertEqual(view._window, (0, 10))
+
+        view.controller.n = 30      # Aktion hat Zeilen entfernt
+        view._pending.set_result(70)
+        done = mock.Mock()
+        view._poll_pending(done, "Error", "failed")
+        done.assert_called_once_with(70)
+        self.assertIsNone(view._pending)
+        self.assertFalse(view._refresh_deferred)
+        self.assertEqual(view._total, 30)
+        self.assertEqual(view.tree.iids, [str(i) for i in range(10)])
+
+    def test_no_extra_refresh_without_deferred_request(self) -> None:
+        view = _view(100, 10)
+        view._pending = Future()
+        view._pending.set_result(None)
+        calls = view.controller.calls
+        view._poll_pending(mock.Mock(), "Error", "failed")
+        self.assertEqual(view.controller.calls, calls)
+
+
+
+class TestExportRows(unittest.TestCase):
+    def test_displayed_columns_and_keys(self) -> None:
+        logs = [
+            {"id": 1, "timestamp": "01.02.2025 10:00:00", "username": "alice", "user_id": 3,
+             "feature": "F", "event": "E", "reference_id": None, "message": None,
+             "log_level": "INFO", "timestamp_utc": "2025-02-01T09:00:00+00:00"},
+            {"timestamp": "t", "username": None, "user_id": 5, "feature": "F", "event": "E",
+             "reference_id": "R", "message": "m", "log_level": "ERROR"},
+        ]
+        rows = list(LogView._export_rows(iter(logs)))
+        self.assertEqual(rows[0], {
+            "timestamp": "01.02.2025 10:00:00", "user": "alice", "feature": "F", "event": "E",
+            "reference_id": "", "message": "", "log_level": "INFO",
+        })
+        self.assertEqual(rows[1]["user"], "ID:5")
+        self.assertEqual(list(rows[1]), ["timestamp", "user", "feature", "event",
+                                         "reference_id", "message", "log_level"])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,178 @@
+"""
+core/tests/test_logger.py
+
+Unit tests for the queued SQLite writer of the Logger: batching, flush(),
+shutdown(), the busy retry and the atomic archive. Each test uses its own
+Logger on a temp DB.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from core.qm_logging.logic import logger as logger_module
+from core.qm_logging.logic.logger import Logger
+from core.qm_logging.models.log_entry import LogEntry
+
+
+def _entry(i: int, timestamp: str) -> LogEntry:
+    return LogEntry(
+        id=None,
+        timestamp=timestamp,
+        user_id=None,
+        username="tester",
+        feature="Test",
+        event=f"E{i}",
+        reference_id=None,
+        message=f"m{i}",
+        log_level="INFO",
+    )
+
+
+class LoggerTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db_path = Path(self._tmp.name) / "logs.db"
+        self.logger = Logger(self.db_path)
+
+    def tearDown(self) -> None:
+        self.logger.shutdown()
+        self.logger.connect().close()
+        self._tmp.cleanup()
+
+    def _count_on_disk(self) -> int:
+        """Zeilen über eine eigene Verbindung zählen (ohne flush())."""
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM logs").fetchone()[0]
+        finally:
+            conn.close()
+
+
+class TestQueuedWriter(LoggerTestCase):
+    def test_own_db_path_is_not_the_singleton(self) -> None:
+        self.assertIsNot(self.logger, logger_module.logger)
+        self.assertEqual(self.logger.db_path, self.db_path)
+
+    def test_batches_are_bounded_and_complete(self) -> None:
+        batches: list[int] = []
+        write = self.logger._write
+
+        def _record(sql, rows):
+            rows = list(rows)
+            batches.append(len(rows))
+            write(sql, rows)
+
+        with mock.patch.object(logger_module, "_BATCH_SIZE", 10), \
+                mock.patch.object(self.logger, "_write", side_effect=_record):
+            for i in range(25):
+                self.logger.log("Test", f"E{i}")
+            self.logger.flush()
+
+        self.assertEqual(sum(batches), 25)
+        self.assertTrue(all(0 < n <= 10 for n in batches), batches)
+        self.assertEqual(self._count_on_disk(), 25)
+
+    def test_flush_makes_entries_visible(self) -> None:
+        for i in range(5):
+            self.logger.log("Test", f"E{i}")
+        self.logger.flush()
+        self.assertEqual(self._count_on_disk(), 5)
+        events = [e.event for e in self.logger.iter_logs(sort_column="id", sort_ascending=True)]
+        self.assertEqual(events, [f"E{i}" for i in range(5)])
+
+    def test_shutdown_drains_queue(self) -> None:
+        for i in range(100):
+            self.logger.log("Test", f"E{i}")
+        self.logger.shutdown()
+        self.assertEqual(self._count_on_disk(), 100)
+        # nach shutdown() wird synchron geschrieben
+        self.logger.log("Test", "late")
+        self.assertEqual(self._count_on_disk(), 101)
+
+    def test_insert_many_from_iter_logs_with_queued_writes(self) -> None:
+        # Regression: flush() lief im Generator unter insert_many()s Lock → Deadlock
+        for i in range(20):
+            self.logger.log("Test", f"E{i}")
+        worker = threading.Thread(
+            target=lambda: self.logger.insert_many(self.logger.iter_logs()), daemon=True
+        )
+        worker.start()
+        worker.join(timeout=5)
+        self.assertFalse(worker.is_alive(), "insert_many(iter_logs()) blockiert")
+        self.assertEqual(self._count_on_disk(), 40)
+
+
+class TestBeginImmediate(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        path = Path(self._tmp.name) / "busy.db"
+        # isolation_level=None: BEGIN/COMMIT selbst steuern; timeout=0 → sofort SQLITE_BUSY
+        self.conn = sqlite3.connect(path, timeout=0, isolation_level=None, check_same_thread=False)
+        self.other = sqlite3.connect(path, timeout=0, isolation_level=None, check_same_thread=False)
+        self.addCleanup(self.conn.close)
+        self.addCleanup(self.other.close)
+
+    def test_retries_while_another_connection_writes(self) -> None:
+        self.other.execute("BEGIN IMMEDIATE")
+        release = threading.Timer(0.1, self.other.execute, ("COMMIT",))
+        release.start()
+        self.addCleanup(release.cancel)
+        Logger._begin_immediate(self.conn)
+        self.assertTrue(self.conn.in_transaction)
+        self.conn.execute("COMMIT")
+
+    def test_busy_is_detected_by_error_code(self) -> None:
+        busy = sqlite3.OperationalError("database is busy")
+        busy.sqlite_errorcode = sqlite3.SQLITE_BUSY
+        conn = mock.Mock()
+        conn.execute.side_effect = [busy, None]
+        with mock.patch.object(logger_module.time, "sleep"):
+            Logger._begin_immediate(conn)
+        self.assertEqual(conn.execute.call_count, 2)
+
+    def test_other_errors_are_not_retried(self) -> None:
+        self.conn.execute("BEGIN")
+        with self.assertRaises(sqlite3.OperationalError):
+            Logger._begin_immediate(self.conn)  # "cannot start a transaction within a transaction"
+        self.conn.execute("ROLLBACK")
+
+
+class TestArchive(LoggerTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.logger.insert_many(
+            [_entry(i, f"2020-01-01T00:00:0{i}+00:00") for i in range(5)]
+            + [_entry(9, "2030-01-01T00:00:00+00:00")]
+        )
+
+    def test_archive_exports_then_deletes(self) -> None:
+        exported: list[LogEntry] = []
+        n = self.logger.archive_older_than("2021-01-01T00:00:00+00:00", exported.extend)
+        self.assertEqual(n, 5)
+        self.assertEqual([e.event for e in exported], [f"E{i}" for i in range(5)])
+        self.assertEqual(self._count_on_disk(), 1)
+
+    def test_raising_sink_leaves_rows(self) -> None:
+        def _sink(entries):
+            next(entries)
+            raise OSError("disk full")
+
+        with self.assertRaises(OSError):
+            self.logger.archive_older_than("2021-01-01T00:00:00+00:00", _sink)
+        self.assertEqual(self._count_on_disk(), 6)
+
+    def test_incomplete_sink_leaves_rows(self) -> None:
+        with self.assertRaises(RuntimeError):
+            self.logger.archive_older_than("2021-01-01T00:00:00+00:00", next)
+        self.assertEqual(self._count_on_disk(), 6)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+core/tests/test_logger_repository.py
+
+Unit tests for LoggerRepository: shared schema, lazy reconnect after close().
+"""
+
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from core.qm_logging.logic import logger_repository
+from core.qm_logging.logic.log_schema import LOG_INDEXES
+from core.qm_logging.logic.logger_repository import LoggerRepository
+from core.qm_logging.models.log_entry import LogEntry
+from core.tests import TEST_DB_DIR
+
+
+class TestLoggerRepository(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch.object(logger_repository, "logs_db_path", TEST_DB_DIR / "repo-logs.db")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.repo = LoggerRepository()
+        self.addCleanup(self.repo.close)
+        self.repo.clear_logs()
+
+    def test_schema_has_shared_indexes(self) -> None:
+        names = {
+            r["name"]
+            for r in self.repo.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+        }
+        self.assertTrue({name for name, _ in LOG_INDEXES} <= names)
+
+    def test_close_then_reuse_reopens(self) -> None:
+        self.repo.close()
+        self.assertIsNone(self.repo._conn)
+        self.repo.insert_log(LogEntry(
+            id=None, timestamp="2025-01-01T00:00:00+00:00", user_id=None, username="u",
+            feature="F", event="E", reference_id=None, message=None, log_level="ERROR",
+        ))
+        self.assertEqual([e.event for e in self.repo.fetch_logs()], ["E"])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+core/tests/test_module_repository.py
+
+Unit tests for ModuleRepository.discover_and_register (batched upsert with
+per-file fallback).
+"""
+
+from __future__ import annotations
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from core.common import module_repository
+from core.common.module_repository import ModuleRepository
+
+
+def _meta(tmp: Path, module_id: str, **extra) -> Path:
+    folder = tmp / module_id
+    folder.mkdir()
+    path = folder / "meta.json"
+    data = {"id": module_id, "label": module_id.title(), "version": "1.0",
+            "main_class": f"{module_id}.gui.View"}
+    data.update(extra)
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+class TestDiscoverAndRegister(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp = Path(self._tmp.name)
+        self.repo = ModuleRepository()
+        self.addCleanup(self.repo.close)
+
+    def _discover(self, files: list[Path]) -> int:
+        with mock.patch.object(module_repository, "discover_meta_files", return_value=files):
+            return self.repo.discover_and_register([self.tmp])
+
+    def tearDown(self) -> None:
+        for module_id in ("t_alpha", "t_bad", "t_omega", "t_broken"):
+            self.repo.delete(module_id)
+
+    def test_all_valid_files_are_registered(self) -> None:
+        n = self._discover([_meta(self.tmp, "t_alpha"), _meta(self.tmp, "t_omega")])
+        self.assertEqual(n, 2)
+        self.assertIsNotNone(self.repo.get_by_id("t_alpha"))
+        self.assertIsNotNone(self.repo.get_by_id("t_omega"))
+
+    def test_bad_descriptor_does_not_abort_the_others(self) -> None:
+        files = [
+            _meta(self.tmp, "t_alpha"),
+            _meta(self.tmp, "t_bad", sort_order=2 ** 70),  # nicht als SQLite-INTEGER bindbar
+            _meta(self.tmp, "t_omega"),
+        ]
+        broken = self.tmp / "t_broken.json"
+        broken.write_text("{", encoding="utf-8")
+        n = self._discover(files + [broken])
+        self.assertEqual(n, 2)
+        self.assertIsNotNone(self.repo.get_by_id("t_alpha"))
+        self.assertIsNone(self.repo.get_by_id("t_bad"))
+        self.assertIsNotNone(self.repo.get_by_id("t_omega"))
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
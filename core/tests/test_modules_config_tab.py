@@ -0,0 +1,38 @@
+"""
+core/tests/test_modules_config_tab.py
+
+Edit state of a row in the module table (no Tk needed).
+"""
+
+from __future__ import annotations
+
+import unittest
+
+from core.common.module_descriptor import ModuleDescriptor
+from core.settings.gui.modules_config_tab import _ModuleRow
+
+
+def _desc(**kw) -> ModuleDescriptor:
+    return ModuleDescriptor(id="m", label="M", module_path="m.gui", class_name="View",
+                            version="1.0", **kw)
+
+
+class TestModuleRow(unittest.TestCase):
+    def test_unchanged_rows_are_clean(self) -> None:
+        self.assertFalse(_ModuleRow(_desc(enabled=1)).dirty)
+        self.assertFalse(_ModuleRow(_desc(enabled=0)).dirty)
+        self.assertFalse(_ModuleRow(_desc(enabled=1, is_core=1)).dirty)
+
+    def test_disabled_core_module_is_saved_enabled(self) -> None:
+        row = _ModuleRow(_desc(enabled=0, is_core=1))
+        self.assertTrue(row.dirty)
+        self.assertEqual(row.to_descriptor().enabled, 1)
+
+    def test_core_module_cannot_be_disabled(self) -> None:
+        row = _ModuleRow(_desc(enabled=1, is_core=1))
+        self.assertFalse(row.toggle("enabled"))
+        self.assertFalse(row.dirty)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+core/tests/test_settings_manager.py
+
+Unit tests for the SettingsManager facade on a temp-DB repository.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from core.settings.logic.settings_manager import SettingsManager
+from core.settings.logic.settings_repository import SettingsRepository
+
+
+class TestSetMany(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        repo = SettingsRepository(Path(self._tmp.name) / "qm-tool.db")
+        self.addCleanup(repo.close)
+        self.manager = SettingsManager(repo)
+
+    def test_global_scope(self) -> None:
+        self.manager.set_many("mail", {"host": "smtp", "port": 25})
+        self.assertEqual(self.manager.get("mail", "host"), "smtp")
+        self.assertEqual(self.manager.get("mail", "port"), 25)
+        # user_id ohne user_specific schreibt/liest global
+        self.assertEqual(self.manager.get("mail", "port", user_id="u1"), 25)
+
+    def test_user_scope(self) -> None:
+        self.manager.set_many("mail", {"sig": "Gruß"}, user_specific=True, user_id="u1")
+        self.assertEqual(self.manager.get("mail", "sig", user_specific=True, user_id="u1"), "Gruß")
+        self.assertIsNone(self.manager.get("mail", "sig", user_specific=True, user_id="u2"))
+        self.assertIsNone(self.manager.get("mail", "sig"))
+
+    def test_user_scope_without_user_id_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            self.manager.set_many("mail", {"sig": "x"}, user_specific=True)
+        self.assertIsNone(self.manager.get("mail", "sig"))
+
+    def test_invalidates_read_cache(self) -> None:
+        self.manager.set("mail", "port", 25)
+        self.assertEqual(self.manager.get("mail", "port"), 25)
+        self.assertEqual(self.manager.get("mail", "host", "none"), "none")
+        self.manager.set_many("mail", {"port": 587, "host": "smtp"})
+        self.assertEqual(self.manager.get("mail", "port"), 587)
+        self.assertEqual(self.manager.get("mail", "host"), "smtp")
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,210 @@
+"""
+core/tests/test_settings_repository.py
+
+Unit tests for SettingsRepository. Each test uses its own repository on a
+temp DB (not the process-wide singleton).
+"""
+
+from __future__ import annotations
+
+import math
+import sqlite3
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from core.settings.logic import settings_repository
+from core.settings.logic.settings_repository import SettingsRepository
+
+
+class SettingsRepositoryTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.db_path = Path(self._tmp.name) / "qm-tool.db"
+
+    def _repo(self) -> SettingsRepository:
+        repo = SettingsRepository(self.db_path)
+        self.addCleanup(repo.close)
+        return repo
+
+
+class TestSetMany(SettingsRepositoryTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.repo = self._repo()
+
+    def test_own_db_path_is_not_the_singleton(self) -> None:
+        self.assertIsNot(self.repo, SettingsRepository())
+        self.assertEqual(self.repo.db_path, self.db_path)
+
+    def test_global_scope(self) -> None:
+        self.repo.set_many("ui", {"theme": "dark", "size": 12, "tabs": ["a", "b"]}, None)
+        self.assertEqual(self.repo.get("ui", "theme", None), "dark")
+        self.assertEqual(self.repo.get("ui", "size", ""), 12)  # "" == global
+        self.assertEqual(self.repo.get("ui", "tabs", None), ["a", "b"])
+        self.assertIsNone(self.repo.get("ui", "theme", "u1"))
+
+    def test_user_scope(self) -> None:
+        self.repo.set_many("ui", {"theme": "dark"}, "u1")
+        self.repo.set_many("ui", {"theme": "light"}, "u2")
+        self.assertEqual(self.repo.get("ui", "theme", "u1"), "dark")
+        self.assertEqual(self.repo.get("ui", "theme", "u2"), "light")
+        self.assertEqual(self.repo.get("ui", "theme", None, "fb"), "fb")
+
+    def test_empty_mapping_is_a_no_op(self) -> None:
+        self.repo.set_many("ui", {}, None)
+        self.assertEqual(self.repo.conn.execute("SELECT COUNT(*) FROM settings").fetchone()[0], 0)
+
+    def test_invalidates_read_cache(self) -> None:
+        self.assertIsNone(self.repo.get("ui", "theme", None))  # cached as absent
+        self.repo.set("ui", "size", 10, None)
+        self.assertEqual(self.repo.get("ui", "size", None), 10)  # cached value
+        self.repo.set_many("ui", {"theme": "dark", "size": 14}, None)
+        self.assertEqual(self.repo.get("ui", "theme", None), "dark")
+        self.assertEqual(self.repo.get("ui", "size", None), 14)
+
+
+class TestReadCache(SettingsRepositoryTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.repo = self._repo()
+
+    def test_cache_is_bounded(self) -> None:
+        with mock.patch.object(settings_repository, "_CACHE_MAX", 3):
+            for i in range(10):
+                self.repo.get("ns", f"missing{i}", None)  # auch Fehltreffer landen im Cache
+        self.assertEqual(len(self.repo._cache), 3)
+        self.assertEqual([k for _, k, _ in self.repo._cache], ["missing7", "missing8", "missing9"])
+
+    def test_hits_are_kept_longest(self) -> None:
+        self.repo.set_many("ns", {"a": 1, "b": 2, "c": 3}, None)
+        with mock.patch.object(settings_repository, "_CACHE_MAX", 2):
+            self.repo.get("ns", "a", None)
+            self.repo.get("ns", "b", None)
+            self.repo.get("ns", "a", None)  # a wieder zuletzt benutzt
+            self.repo.get("ns", "c", None)  # verdrängt b
+        self.assertEqual([k for _, k, _ in self.repo._cache], ["a", "c"])
+        self.assertEqual(self.repo.get("ns", "b", None), 2)  # Fehlt nur im Cache
+
+
+class TestValueRoundTrip(SettingsRepositoryTestCase):
+    """Werte kommen exakt zurück – auch mit installiertem orjson."""
+
+    def _round_trip(self, value):
+        self._repo().set("ns", "k", value, None)
+        return self._repo().get("ns", "k", None)  # neue Instanz → ohne Lese-Cache
+
+    def test_non_finite_floats(self) -> None:
+        self.assertTrue(math.isnan(self._round_trip(float("nan"))))
+        self.assertEqual(self._round_trip(float("inf")), float("inf"))
+        got = self._round_trip({"limits": [float("-inf"), 1.5]})
+        self.assertEqual(got, {"limits": [float("-inf"), 1.5]})
+
+    def test_big_ints(self) -> None:
+        for value in (2 ** 70, -(2 ** 63) - 1, 2 ** 64 - 1):
+            got = self._round_trip(value)
+            self.assertEqual(got, value)
+            self.assertIs(type(got), int)
+        self.assertEqual(self._round_trip([2 ** 70, "x"]), [2 ** 70, "x"])
+
+    def test_long_digit_strings_stay_strings(self) -> None:
+        self.assertEqual(self._round_trip("1234567890123456789012"), "1234567890123456789012")
+
+    def test_int_dict_keys(self) -> None:
+        self.assertEqual(self._round_trip({1: "a"}), {"1": "a"})
+
+
+# Schema der settings-Tabelle wie vor der Migration (Rowid-Tabelle, user_id NULL = global)
+_BASELINE_SCHEMA = """
+    CREATE TABLE settings(
+        namespace TEXT NOT NULL,
+        key       TEXT NOT NULL,
+        value     TEXT NOT NULL,
+        user_id   TEXT,
+        PRIMARY KEY(namespace,key,user_id)
+    )
+"""
+
+
+class TestMigration(SettingsRepositoryTestCase):
+    def _legacy_db(self, schema: str, insert_sql: str, rows: list[tuple]) -> None:
+        conn = sqlite3.connect(self.db_path)
+        with conn:
+            conn.execute(schema)
+            conn.executemany(insert_sql, rows)
+        conn.close()
+
+    def _table(self, repo: SettingsRepository) -> list[tuple]:
+        return [tuple(r) for r in repo.conn.execute(
+            "SELECT namespace, key, value, user_id FROM settings ORDER BY namespace, key, user_id"
+        )]
+
+    def _ddl(self, repo: SettingsRepository) -> str:
+        return repo.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='settings'"
+        ).fetchone()[0]
+
+    def test_baseline_null_user_ids_are_deduplicated(self) -> None:
+        self._legacy_db(
+            _BASELINE_SCHEMA,
+            "INSERT INTO settings (namespace, key, value, user_id) VALUES (?, ?, ?, ?)",
+            [
+                ("ui", "theme", '"light"', None),
+                ("ui", "theme", '"dark"', None),   # NULL im PK → Duplikat; neuester gewinnt
+                ("ui", "theme", '"blue"', "u1"),
+                ("ui", "size", "12", None),
+                ("mail", "sig", '"Gruß"', "u2"),
+            ],
+        )
+        repo = self._repo()
+        self.assertIn("WITHOUT ROWID", self._ddl(repo).upper())
+        self.assertEqual(self._table(repo), [
+            ("mail", "sig", '"Gruß"', "u2"),
+            ("ui", "size", "12", ""),
+            ("ui", "theme", '"dark"', ""),
+            ("ui", "theme", '"blue"', "u1"),
+        ])
+        self.assertEqual(repo.get("ui", "theme", None), "dark")
+        self.assertEqual(repo.get("ui", "theme", "u1"), "blue")
+        # Upsert global legt nach der Migration kein Duplikat mehr an
+        repo.set("ui", "theme", "light", None)
+        self.assertEqual(len(self._table(repo)), 4)
+
+    def test_section_schema(self) -> None:
+        self._legacy_db(
+            "CREATE TABLE settings(section TEXT, key TEXT, value TEXT)",
+            "INSERT INTO settings (section, key, value) VALUES (?, ?, ?)",
+            [("general", "lang", '"de"'), ("general", "lang", '"en"'), ("mail", "port", "25")],
+        )
+        repo = self._repo()
+        self.assertEqual(self._table(repo), [
+            ("general", "lang", '"en"', ""),
+            ("mail", "port", "25", ""),
+        ])
+
+    def test_key_value_schema(self) -> None:
+        self._legacy_db(
+            "CREATE TABLE settings(key TEXT, value TEXT)",
+            "INSERT INTO settings (key, value) VALUES (?, ?)",
+            [("lang", '"de"')],
+        )
+        self.assertEqual(self._table(self._repo()), [("app", "lang", '"de"', "")])
+
+    def test_migrated_schema_is_kept(self) -> None:
+        self._legacy_db(
+            _BASELINE_SCHEMA,
+            "INSERT INTO settings (namespace, key, value, user_id) VALUES (?, ?, ?, ?)",
+            [("ui", "theme", '"dark"', None)],
+        )
+        first = self._repo()
+        before = (self._ddl(first), self._table(first))
+        with mock.patch.object(SettingsRepository, "_hard_rebuild") as rebuild:
+            second = self._repo()
+        rebuild.assert_not_called()
+        self.assertEqual((self._ddl(second), self._table(second)), before)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,39 @@
+"""
+core/tests/test_settings_view_pool.py
+
+SettingsView owns its import pool: destroy() cancels imports that have not
+started yet (no Tk needed; Frame.destroy is patched out).
+"""
+
+from __future__ import annotations
+
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk
+from unittest import mock
+
+from core.settings.gui.settings_view import SettingsView
+
+
+class TestImportPool(unittest.TestCase):
+    def test_destroy_cancels_pending_imports(self) -> None:
+        view = SettingsView.__new__(SettingsView)
+        view._import_pool = ThreadPoolExecutor(max_workers=1)
+        release = threading.Event()
+        running = view._import_pool.submit(release.wait, 5)
+        pending = view._import_pool.submit(lambda: "never")
+
+        with mock.patch.object(ttk.Frame, "destroy") as frame_destroy:
+            view.destroy()
+        release.set()
+
+        frame_destroy.assert_called_once()
+        self.assertTrue(pending.cancelled())
+        self.assertTrue(running.result(timeout=5))
+        with self.assertRaises(RuntimeError):  # Pool ist geschlossen
+            view._import_pool.submit(lambda: None)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    unittest.main()
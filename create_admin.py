@@ -36,13 +36,12 @@ while not username:
 pw = read_input("Passwort: ", hide=True)
 email = read_input("E-Mail: ").strip()
 
-ok = repo.create_user(
+user_id = repo.insert_user(
     {"username": username, "password": pw, "email": email},
     role=UserRole.ADMIN,
 )
+ok = user_id is not None
 
 if ok:
-    user = repo.get_user(username)
-    if user:
-        _seed_documents_admin(str(getattr(user, "id", "")))
+    _seed_documents_admin(str(user_id))
 print("✅  Admin angelegt" if ok else "❌  Benutzer existiert schon")
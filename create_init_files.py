@@ -4,15 +4,33 @@ def create_init_files(root_dir):
     """
     Legt in jedem Ordner unter root_dir (inklusive root_dir) eine leere __init__.py an,
     sofern diese noch nicht existiert.
+
+    Ein os.scandir() pro Ordner liefert Unterordner und __init__.py-Prüfung
+    zugleich (kein extra stat per os.path.exists).
     """
-    for dirpath, dirnames, filenames in os.walk(root_dir):
-        init_path = os.path.join(dirpath, '__init__.py')
-        if not os.path.exists(init_path):
-            with open(init_path, 'w', encoding='utf-8') as f:
+    stack = [root_dir]
+    while stack:
+        dirpath = stack.pop()
+        has_init = False
+        subdirs = []
+        try:
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    if entry.name == '__init__.py':
+                        has_init = True
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except OSError:
+            continue  # unlesbarer Ordner – wie os.walk überspringen
+
+        if not has_init:
+            with open(os.path.join(dirpath, '__init__.py'), 'w', encoding='utf-8') as f:
                 pass  # Leere Datei erzeugen
             print(f'__init__.py erstellt in: {dirpath}')
         else:
             print(f'__init__.py existiert bereits in: {dirpath}')
+        # umgekehrt auf den Stack → gleiche Reihenfolge wie os.walk (top-down)
+        stack.extend(reversed(subdirs))
 
 if __name__ == '__main__':
     # Root-Verzeichnis ist der Ordner, in dem dieses Skript liegt
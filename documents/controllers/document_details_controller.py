@@ -4,6 +4,7 @@ REFACTORED: Uses UIStateService instead of direct workflow/permission checks.
 """
 
 from __future__ import annotations
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Optional
 import os
 
@@ -13,12 +14,16 @@ from documents.services.ui_state_service import UIStateService
 from documents.dto.document_details import DocumentDetails
 from documents.dto.controls_state import ControlsState
 
-# Word metadata bridge (optional)
-try:
-    from documents.logic.wordmeta_bridge import extract_core_and_comments
-except Exception:
-    def extract_core_and_comments(path: str):
-        return {}, []
+# Word metadata bridge (optional) – imported on first use, not at module load:
+# it pulls in the whole word_meta reader stack.
+@lru_cache(maxsize=None)
+def _wordmeta_extractor() -> Callable[[str], tuple]:
+    try:
+        from documents.logic.wordmeta_bridge import extract_core_and_comments
+    except Exception:
+        def extract_core_and_comments(path: str):
+            return {}, []
+    return extract_core_and_comments
 
 
 class DocumentDetailsController:
@@ -173,7 +178,7 @@ class DocumentDetailsController:
             return {}
 
         try:
-            core, _ = extract_core_and_comments(path)
+            core, _ = _wordmeta_extractor()(path)
             return core
         except Exception:
             return {}
@@ -606,8 +606,7 @@ class DocumentsView(ttk.Frame):
         self._loading = True
         try:
             # Clear table
-            for iid in self.tree.get_children():
-                self.tree.delete(iid)
+            self.tree.delete(*self.tree.get_children())
             self._rows.clear()
 
             # Collect filters
@@ -746,8 +745,7 @@ class DocumentsView(ttk.Frame):
     def _fill_comments(self, rec: Optional[DocumentRecord]) -> None:
         """Fill comments tab."""
         # Clear tree
-        for i in self.tv_comments.get_children():
-            self.tv_comments.delete(i)
+        self.tv_comments.delete(*self.tv_comments.get_children())
 
         if not rec or not self.details_ctrl:
             return
@@ -806,42 +804,6 @@ class DocumentsView(ttk.Frame):
         ttk.Button(frm, text=T("common.close") or "Schließen", command=win.destroy).pack(anchor="e", pady=(8, 0))
 
     # ================================================================== CONTROLS STATE
-    def _refresh_controls(self, rec: Optional[DocumentRecord]) -> None:
-        """Update button states via DocumentDetailsController (NEW ARCHITECTURE!)."""
-        # Default:  all disabled
-        for btn in [self.btn_workflow, self.btn_next, self.btn_back_to_draft, self.btn_archive, self.btn_open, self.btn_copy]:
-            btn.configure(state="disabled")
-        self.btn_assign_roles.configure(state="disabled")
-
-        if not rec or not self.details_ctrl:
-            self.btn_workflow.configure(text="Workflow")
-            self.btn_next.configure(text="Nächster Schritt")
-            return
-
-        # Get user roles (NEW:  using PermissionPolicy)
-        user = getattr(AppContext, "current_user", None)
-        user_roles = self._get_user_roles(user)
-        assigned_roles = self._get_assigned_roles(rec.doc_id.value, user)
-
-        # Compute state via controller (NEW!)
-        state:  ControlsState = self.details_ctrl.compute_controls_state(
-            rec,
-            user_roles=user_roles,
-            assigned_roles=assigned_roles
-        )
-
-        # Apply state
-        self.btn_workflow.configure(text=state.workflow_text)
-        self.btn_next.configure(text=state.next_text)
-
-        self.btn_open.configure(state=("normal" if state.can_open else "disabled"))
-        self.btn_copy.configure(state=("normal" if state.can_copy else "disabled"))
-        self.btn_assign_roles.configure(state=("normal" if state.can_assign_roles else "disabled"))
-        self.btn_workflow.configure(state=("normal" if state.can_toggle_workflow else "disabled"))
-        self.btn_next.configure(state=("normal" if state.can_next else "disabled"))
-        self.btn_back_to_draft.configure(state=("normal" if state.can_back_to_draft else "disabled"))
-        self.btn_archive.configure(state=("normal" if state.can_archive else "disabled"))
-
     def _get_user_roles(self, user: object) -> list[str]:
         """
         Get user's system roles.
@@ -879,15 +841,8 @@ class DocumentsView(ttk.Frame):
 
     def _refresh_controls(self, rec: Optional[DocumentRecord]) -> None:
         """Update button states via UIStateService."""
-        # Default:  all disabled
-        for btn in [self.btn_workflow, self.btn_next, self.btn_back_to_draft,
-                    self.btn_archive, self.btn_open, self.btn_copy]:
-            btn.configure(state="disabled")
-        self.btn_assign_roles.configure(state="disabled")
-
         if not rec or not self.details_ctrl:
-            self.btn_workflow.configure(text="Workflow")
-            self.btn_next.configure(text="Nächster Schritt")
+            self._apply_controls(ControlsState.disabled(), "Workflow", "Nächster Schritt")
             return
 
         # Get user info
@@ -895,33 +850,32 @@ class DocumentsView(ttk.Frame):
         user_roles = self._get_user_roles(user)
         assigned_roles = self._get_assigned_roles(rec.doc_id.value, user)
 
-        # Get user_id for ownership check
-        user_id = None
-        if user:
-            for attr in ("id", "user_id", "username"):
-                val = getattr(user, attr, None)
-                if val:
-                    user_id = str(val)
-                    break
-
         # Compute state via controller
-        state: ControlsState = self.details_ctrl.compute_controls_state(
-            rec,
-            user_roles=user_roles,
-            assigned_roles=assigned_roles
-        )
-
-        # Apply state
-        self.btn_workflow.configure(text=state.workflow_text)
-        self.btn_next.configure(text=state.next_text)
-
-        self.btn_open.configure(state=("normal" if state.can_open else "disabled"))
-        self.btn_copy.configure(state=("normal" if state.can_copy else "disabled"))
-        self.btn_assign_roles.configure(state=("normal" if state.can_assign_roles else "disabled"))
-        self.btn_workflow.configure(state=("normal" if state.can_toggle_workflow else "disabled"))
-        self.btn_next.configure(state=("normal" if state.can_next else "disabled"))
-        self.btn_back_to_draft.configure(state=("normal" if state.can_back_to_draft else "disabled"))
-        self.btn_archive.configure(state=("normal" if state.can_archive else "disabled"))
+        try:
+            state: ControlsState = self.details_ctrl.compute_controls_state(
+                rec,
+                user_roles=user_roles,
+                assigned_roles=assigned_roles
+            )
+        except Exception:
+            # Never leave the previous document's buttons enabled
+            self._apply_controls(ControlsState.disabled(), "Workflow", "Nächster Schritt")
+            raise
+
+        self._apply_controls(state, state.workflow_text, state.next_text)
+
+    def _apply_controls(self, state: ControlsState, workflow_text: str, next_text: str) -> None:
+        """One configure() per button (text + state together)."""
+        def on(flag: bool) -> str:
+            return "normal" if flag else "disabled"
+
+        self.btn_workflow.configure(text=workflow_text, state=on(state.can_toggle_workflow))
+        self.btn_next.configure(text=next_text, state=on(state.can_next))
+        self.btn_open.configure(state=on(state.can_open))
+        self.btn_copy.configure(state=on(state.can_copy))
+        self.btn_assign_roles.configure(state=on(state.can_assign_roles))
+        self.btn_back_to_draft.configure(state=on(state.can_back_to_draft))
+        self.btn_archive.configure(state=on(state.can_archive))
 
     def _get_assigned_roles(self, doc_id: str, user: object) -> list[str]:
         """Get user's assigned roles on this document.
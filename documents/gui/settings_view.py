@@ -27,6 +27,9 @@ from core.settings.logic.settings_manager import SettingsManager
 from documents.logic.rbac_service import RBACService
 
 
+# Fallback für SettingsManager.get: unterscheidet "nicht gespeichert" von jedem Wert
+_UNSET = object()
+
 # Dialogs (declared below in same file for single-file shipping)
 # - ManageRolesDialog
 # - RoleRequestDialog
@@ -39,6 +42,8 @@ class DocumentsSettingsTab(ttk.Frame):
     def __init__(self, parent: tk.Misc, *, settings_manager: SettingsManager) -> None:
         super().__init__(parent)
         self._sm = settings_manager
+        self._loaded: dict = {}
+        self._stored: set[str] = set()  # Keys, die tatsächlich in den Settings stehen
 
         self.columnconfigure(1, weight=1)
 
@@ -130,7 +135,12 @@ class DocumentsSettingsTab(ttk.Frame):
 
     def _load(self) -> None:
         d = self._defaults()
-        get = lambda k: self._sm.get(self._FEATURE_ID, k, d[k])
+        # Geladene Werte merken → _on_save schreibt nur Änderungen und Keys,
+        # die bisher nur als Default angezeigt wurden (nie gespeichert)
+        raw = {k: self._sm.get(self._FEATURE_ID, k, _UNSET) for k in d}
+        self._stored = {k for k, v in raw.items() if v is not _UNSET}
+        self._loaded = {k: d[k] if v is _UNSET else v for k, v in raw.items()}
+        get = self._loaded.__getitem__
         self.e_root.delete(0, "end"); self.e_root.insert(0, str(get("root_path")))
         self.e_prefix.delete(0, "end"); self.e_prefix.insert(0, str(get("id_prefix")))
         self.e_pattern.delete(0, "end"); self.e_pattern.insert(0, str(get("id_pattern")))
@@ -158,16 +168,19 @@ class DocumentsSettingsTab(ttk.Frame):
         for _, key in self._rbac_rows:
             vals[key] = self._rbac_entries[key].get().strip()
 
-        for k, v in vals.items():
-            self._sm.set(self._FEATURE_ID, k, v)
+        changed = {
+            k: v for k, v in vals.items()
+            if k not in self._stored or self._loaded.get(k, _UNSET) != v
+        }
+        self._sm.set_many(self._FEATURE_ID, changed)
+        self._loaded.update(vals)
+        self._stored.update(vals)
 
         messagebox.showinfo(title=tr("documents.settings.saved", "Saved"),
                             message=tr("documents.settings.saved_msg", "Settings saved."), parent=self)
 
     def _on_reset(self) -> None:
-        d = self._defaults()
-        for k, v in d.items():
-            self._sm.set(self._FEATURE_ID, k, v)
+        self._sm.set_many(self._FEATURE_ID, self._defaults())
         self._load()
 
     # ---- Role Dialogs --------------------------------------------------------
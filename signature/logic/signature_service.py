@@ -98,11 +98,13 @@ class SignatureService:
         )
 
     def save_global_offset_defaults(self, offsets: LabelOffsets) -> None:
-        self._sm.set(_FEATURE_ID, "g_name_above", float(offsets.name_above))
-        self._sm.set(_FEATURE_ID, "g_name_below", float(offsets.name_below))
-        self._sm.set(_FEATURE_ID, "g_date_above", float(offsets.date_above))
-        self._sm.set(_FEATURE_ID, "g_date_below", float(offsets.date_below))
-        self._sm.set(_FEATURE_ID, "g_x_offset", float(offsets.x_offset))
+        self._sm.set_many(_FEATURE_ID, {
+            "g_name_above": float(offsets.name_above),
+            "g_name_below": float(offsets.name_below),
+            "g_date_above": float(offsets.date_above),
+            "g_date_below": float(offsets.date_below),
+            "g_x_offset": float(offsets.x_offset),
+        })
         self._persist_settings()
 
     # -------- User-scoped config --------------------------------------------
@@ -158,29 +160,30 @@ class SignatureService:
         user = getattr(ctx, "current_user", None) if ctx else None
         uid = getattr(user, "id", None)
 
-        def set_user(k: str, v):
-            if uid:
-                self._sm.set(_FEATURE_ID, k, v, user_specific=True, user_id=uid)
-            else:
-                self._sm.set(_FEATURE_ID, k, v)
-
-        set_user("stroke_width", cfg.stroke_width)
-        set_user("embed_name", cfg.embed_name)
-        set_user("embed_date", cfg.embed_date)
-        set_user("name_position", cfg.name_position.value)
-        set_user("date_position", cfg.date_position.value)
-        set_user("date_format", cfg.date_format)
-        set_user("name_above", float(cfg.label_offsets.name_above))
-        set_user("name_below", float(cfg.label_offsets.name_below))
-        set_user("date_above", float(cfg.label_offsets.date_above))
-        set_user("date_below", float(cfg.label_offsets.date_below))
-        set_user("x_offset", float(cfg.label_offsets.x_offset))
-        set_user("label_color", cfg.label_color)
-        set_user("name_font_size", int(cfg.name_font_size))
-        set_user("date_font_size", int(cfg.date_font_size))
-        set_user("naming_mode", cfg.naming_mode.value)
-        set_user("external_strategy_id", cfg.external_strategy_id)
-        set_user("user_pwd_required", cfg.user_pwd_required)
+        # All user-scoped keys in one transaction (one commit instead of 17)
+        values = {
+            "stroke_width": cfg.stroke_width,
+            "embed_name": cfg.embed_name,
+            "embed_date": cfg.embed_date,
+            "name_position": cfg.name_position.value,
+            "date_position": cfg.date_position.value,
+            "date_format": cfg.date_format,
+            "name_above": float(cfg.label_offsets.name_above),
+            "name_below": float(cfg.label_offsets.name_below),
+            "date_above": float(cfg.label_offsets.date_above),
+            "date_below": float(cfg.label_offsets.date_below),
+            "x_offset": float(cfg.label_offsets.x_offset),
+            "label_color": cfg.label_color,
+            "name_font_size": int(cfg.name_font_size),
+            "date_font_size": int(cfg.date_font_size),
+            "naming_mode": cfg.naming_mode.value,
+            "external_strategy_id": cfg.external_strategy_id,
+            "user_pwd_required": cfg.user_pwd_required,
+        }
+        if uid:
+            self._sm.set_many(_FEATURE_ID, values, user_specific=True, user_id=uid)
+        else:
+            self._sm.set_many(_FEATURE_ID, values)
 
         self._sm.set(_FEATURE_ID, "admin_password_policy", cfg.admin_password_policy.value)
         self._persist_settings()
@@ -91,10 +91,18 @@ class UserRepository(DatabaseAccess):
         Expected keys: username, password, email, role, full_name, phone,
                        department, job_title
         """
+        return self.insert_user(data, role) is not None
+
+    def insert_user(self, data: dict, role: UserRole) -> Optional[int]:
+        """
+        Like :meth:`create_user_full`, but returns the new user id
+        (``None`` if the username already exists) – saves a follow-up
+        SELECT when the caller needs the id.
+        """
         pw_hash = bcrypt.hashpw(data["password"].encode(), bcrypt.gensalt())
         try:
             with self._connect() as conn:
-                conn.execute(
+                cur = conn.execute(
                     """
                     INSERT INTO users
                       (username, password_hash, email, role,
@@ -112,9 +120,9 @@ class UserRepository(DatabaseAccess):
                         data.get("job_title", ""),
                     ),
                 )
-            return True
+            return cur.lastrowid
         except sqlite3.IntegrityError:
-            return False
+            return None
 
     def create_user(self, data: dict, role: UserRole = UserRole.USER) -> bool:
         """Alias für create_user_full – akzeptiert Minimal-Dict."""
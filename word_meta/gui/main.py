@@ -99,8 +99,7 @@ class WordCommentsViewer(ttk.Frame):
         self._populate_tree()
 
     def _populate_tree(self) -> None:
-        for iid in self.tree.get_children():
-            self.tree.delete(iid)
+        self.tree.delete(*self.tree.get_children())
         self.detail.delete("1.0", "end")
         self.info_lbl.configure(text="Select a comment to view details.")
         self.meta_lbl.configure(text="")